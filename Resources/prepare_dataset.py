@@ -356,6 +356,10 @@ def raw_wav_files(source_dir: Path) -> List[Path]:
     THE per-day mode's audio set.  Mirrors the legacy glob (``*.WAV``
     then ``*.wav``, sorted within each) but drops AppleDouble sidecars
     and other hidden files via :func:`azus_common.is_raw_wav_name`.
+    The folder is read with ONE ``os.scandir`` pass and plain suffix
+    tests instead of two globs — raw folders hold thousands of WAVs,
+    often on an SD card or network mount, and each glob re-lists the
+    whole folder and builds a Path per entry before filtering.
     Without that filter a single ``._20240408_120000.WAV`` — which macOS
     creates on any exFAT SD card, and which every other tool in the
     pipeline already skips — has no 8-digit prefix and would abort the
@@ -370,12 +374,20 @@ def raw_wav_files(source_dir: Path) -> List[Path]:
     Returns:
         The WAV paths, uppercase-glob matches first then lowercase.
     """
-    return [
-        p for p in (
-            sorted(source_dir.glob("*.WAV")) + sorted(source_dir.glob("*.wav"))
-        )
-        if azus_common.is_raw_wav_name(p.name)
-    ]
+    upper: List[Path] = []
+    lower: List[Path] = []
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            # Exact-case suffixes, as the two globs matched (".Wav" never
+            # did); Paths are built only for the recordings kept.
+            if not azus_common.is_raw_wav_name(name):
+                continue
+            if name.endswith(".WAV"):
+                upper.append(source_dir / name)
+            elif name.endswith(".wav"):
+                lower.append(source_dir / name)
+    return sorted(upper) + sorted(lower)
 
 
 def group_wavs_by_day(wav_files: Sequence[Path]) -> Dict[str, List[Path]]:
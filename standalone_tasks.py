@@ -29,18 +29,24 @@ import concurrent.futures
 import csv
 import glob
 import hashlib
+import itertools
 import json
 import logging
 import os
 import re
 import shutil
+import stat
 import sys
 import threading
 import time
 import zipfile
 from pathlib import Path
 from string import Template
-from typing import Any, Dict, List, Optional, TextIO, Tuple
+from typing import (
+    Any, Dict, FrozenSet, Iterable, List, Optional, TextIO, Tuple,
+)
+
+from pydantic import AliasChoices
 
 # ---------------------------------------------------------------------------
 # Project models (no external dependencies beyond Pydantic)
@@ -136,15 +142,17 @@ def load_project_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         )
 
     config_file = Path(config_path)
-    if not config_file.exists():
+    # Open directly rather than exists()-then-open: one syscall fewer, and
+    # no window for the file to vanish between the check and the open.
+    try:
+        with open(config_file, "r", encoding="utf-8") as fh:
+            config = json.load(fh)
+    except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"Project config not found: {config_file}\n"
             f"Copy templates/project_config.json.example to "
             f"Resources/project_config.json and fill in your project details."
-        )
-
-    with open(config_file, "r", encoding="utf-8") as fh:
-        config = json.load(fh)
+        ) from exc
 
     logger.info("Loaded project config: %s", config_file.name)
     return config
@@ -728,12 +736,21 @@ def resolve_dataset_archives(
     if single.is_file():
         archives.append(single)
     try:
-        for entry in sorted(staging_folder.iterdir()):
-            if not entry.is_file():
-                continue
-            parsed = azus_common.parse_day_zip_name(entry.name)
-            if parsed is not None and parsed[0] == esid:
-                archives.append(entry)
+        # os.scandir: the name is parsed before any stat, and is_file() on
+        # a DirEntry usually needs no extra syscall.  Sorting by name
+        # matches the Path order the iterdir() version produced.
+        with os.scandir(staging_folder) as entries:
+            day_entries = sorted(
+                (
+                    entry for entry in entries
+                    if (parsed := azus_common.parse_day_zip_name(entry.name))
+                    is not None
+                    and parsed[0] == esid
+                    and entry.is_file()
+                ),
+                key=lambda entry: entry.name,
+            )
+        archives.extend(staging_folder / entry.name for entry in day_entries)
     except OSError as exc:
         return [], None, [
             f"Staging folder is unreadable ({type(exc).__name__}: {exc}): "
@@ -1133,6 +1150,37 @@ def verify_dataset_integrity(
 #  CSV parsing and validation
 # ===================================================================
 
+def _collector_csv_columns() -> FrozenSet[str]:
+    """Every input key ``DataCollector`` can be populated from.
+
+    Collects, per field, the field name, its ``alias`` and its
+    ``validation_alias`` (a plain string or each string in an
+    ``AliasChoices``).  Over-including is harmless: a key the model does
+    not read is ignored by validation.  Missing one would silently drop
+    that column from every parsed row.
+
+    Returns:
+        The set of column names to keep from a collectors CSV row.
+    """
+    columns = set()
+    for name, field in DataCollector.model_fields.items():
+        columns.add(name)
+        if field.alias:
+            columns.add(field.alias)
+        alias = field.validation_alias
+        if isinstance(alias, str):
+            columns.add(alias)
+        elif isinstance(alias, AliasChoices):
+            columns.update(c for c in alias.choices if isinstance(c, str))
+    return frozenset(columns)
+
+
+# The collectors spreadsheet carries many more columns than the model
+# uses; parse_collectors_csv builds each row's dict from these columns
+# only instead of from the whole row.
+_COLLECTOR_CSV_COLUMNS = _collector_csv_columns()
+
+
 def parse_collectors_csv(
     csv_file_path: str,
     dataset_category: str,
@@ -1159,8 +1207,8 @@ def parse_collectors_csv(
         project_config = load_project_config()
 
     with open(csv_file_path, mode="r", encoding="utf-8") as csv_file:
-        csv_reader = csv.DictReader(csv_file)
-        csv_headers = csv_reader.fieldnames
+        csv_reader = csv.reader(csv_file)
+        csv_headers = next(csv_reader, None)
 
         if not csv_headers:
             raise ValueError("No headers found in the CSV file.")
@@ -1179,7 +1227,23 @@ def parse_collectors_csv(
                 f"Expected CSV headers not found: {missing_headers}"
             )
 
-        data = [DataCollector.model_validate(row) for row in csv_reader]
+        # Same row semantics as csv.DictReader (blank lines skipped, a
+        # short row's missing cells read as None, a repeated header's
+        # last column wins), but each dict holds only the columns the
+        # model reads.
+        column_index = {name: i for i, name in enumerate(csv_headers)}
+        wanted = [
+            (name, i) for name, i in column_index.items()
+            if name in _COLLECTOR_CSV_COLUMNS
+        ]
+        data = []
+        for row in csv_reader:
+            if not row:
+                continue
+            width = len(row)
+            data.append(DataCollector.model_validate(
+                {name: row[i] if i < width else None for name, i in wanted}
+            ))
 
     logger.info("Parsed %d rows from %s", len(data), Path(csv_file_path).name)
     return data
@@ -1399,6 +1463,57 @@ def read_references_from_csv(csv_path: Optional[str]) -> List[Reference]:
 #  File discovery
 # ===================================================================
 
+def _locate_files(
+    dataset_dir: Path,
+    filenames: List[str],
+) -> Tuple[Dict[str, Optional[str]], List[str]]:
+    """Resolve each filename to a regular file inside ``dataset_dir``.
+
+    The directory is listed once with ``os.scandir`` and names are looked
+    up in that listing, rather than paying an ``exists()`` + ``is_file()``
+    stat pair per name — a manifest lists every day archive, and each
+    stat is a round trip on a network / Dropbox volume.
+    ``DirEntry.is_file()`` follows symlinks exactly like ``Path.is_file()``.
+
+    A name that is not in the listing verbatim still gets one
+    ``Path.is_file()`` check, so sub-paths and case-insensitive
+    filesystems (macOS) resolve exactly as before.  The same per-name
+    check covers a directory that may be traversed but not listed
+    (execute without read permission): ``os.scandir`` raises
+    ``PermissionError`` there, yet each file can still be opened by name.
+
+    Args:
+        dataset_dir: Directory the filenames are relative to.
+        filenames: Names to locate, in the order they should be reported.
+
+    Returns:
+        Tuple of (filename -> full path or None, list of missing filenames).
+    """
+    try:
+        with os.scandir(dataset_dir) as entries:
+            on_disk = {
+                entry.name: entry.path
+                for entry in entries if entry.is_file()
+            }
+    except PermissionError:
+        on_disk = {}
+
+    found_files: Dict[str, Optional[str]] = {}
+    missing_files: List[str] = []
+
+    for filename in filenames:
+        file_path = on_disk.get(filename)
+        if file_path is None:
+            candidate = dataset_dir / filename
+            if candidate.is_file():
+                file_path = str(candidate)
+        found_files[filename] = file_path
+        if file_path is None:
+            missing_files.append(filename)
+
+    return found_files, missing_files
+
+
 def read_upload_manifest(
     manifest_path: Path,
     dataset_dir: Path,
@@ -1434,16 +1549,7 @@ def read_upload_manifest(
     logger.info("Manifest lists %d files to upload", len(files_to_upload))
 
     # Locate each file on disk
-    found_files: Dict[str, Optional[str]] = {}
-    missing_files: List[str] = []
-
-    for filename in files_to_upload:
-        file_path = dataset_dir / filename
-        if file_path.exists() and file_path.is_file():
-            found_files[filename] = str(file_path)
-        else:
-            found_files[filename] = None
-            missing_files.append(filename)
+    found_files, missing_files = _locate_files(dataset_dir, files_to_upload)
 
     found_count = sum(1 for v in found_files.values() if v is not None)
     logger.info("Found %d/%d files", found_count, len(files_to_upload))
@@ -1490,9 +1596,12 @@ def find_dataset_files(
         ValueError: If ``staging_folder`` exists but is not a directory.
     """
     dataset_dir = Path(staging_folder)
-    if not dataset_dir.exists():
+    # One stat answers both questions (exists() + is_dir() was two).
+    try:
+        is_dir = stat.S_ISDIR(dataset_dir.stat().st_mode)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(f"Staging folder not found: {staging_folder}")
-    if not dataset_dir.is_dir():
+    if not is_dir:
         raise ValueError(f"Path is not a directory: {staging_folder}")
 
     # --- Try upload manifest first ---
@@ -1510,20 +1619,11 @@ def find_dataset_files(
             project_config = load_project_config()
         required_files = project_config.get("default_required_files", [])
 
-    found_files: Dict[str, Optional[str]] = {}
-    missing_files: List[str] = []
-
-    for filename in required_files:
-        file_path = dataset_dir / filename
-        if file_path.exists() and file_path.is_file():
-            found_files[filename] = str(file_path)
-        else:
-            found_files[filename] = None
-            missing_files.append(filename)
+    found_files, missing_files = _locate_files(dataset_dir, required_files)
 
     found_count = sum(1 for v in found_files.values() if v is not None)
     logger.info(
-        "Found %d/%d files for %s", found_count, len(required_files), zip_path.name
+        "Found %d/%d files for %s", found_count, len(required_files), dataset_dir.name
     )
     if missing_files:
         logger.warning("Missing %d files: %s", len(missing_files), ", ".join(missing_files[:5]))
@@ -1592,14 +1692,16 @@ def get_esid_file_pairs(files: List[str]) -> List[Tuple[str, str]]:
     """
     pairs: List[Tuple[str, str]] = []
     for f in files:
-        esid = azus_common.parse_esid(Path(f).name)
+        # os.path.basename is plain string splitting — no Path object per
+        # file just to read its last component.
+        name = os.path.basename(f)
+        esid = azus_common.parse_esid(name)
         if esid is None:
             # The old last-underscore-segment split would have produced
             # garbage here (e.g. "v2" from ESID_005_v2.zip) and silently
             # attached the wrong collector metadata downstream.
             logger.warning(
-                "Cannot parse an ESID from ZIP name %s — skipping it.",
-                Path(f).name,
+                "Cannot parse an ESID from ZIP name %s — skipping it.", name,
             )
             continue
         pairs.append((esid, f))
@@ -1610,6 +1712,15 @@ def get_esid_file_pairs(files: List[str]) -> List[Tuple[str, str]]:
 #  Recording date extraction
 # ===================================================================
 
+# Every casing of ".wav" (".wav", ".WAV", ".Wav", ".wAV", ...).  A tuple
+# suffix test runs in C with no per-name allocation, unlike
+# ``name.lower().endswith(".wav")``; listing only the common spellings
+# would silently drop a mixed-case name that the lower() test accepted.
+_WAV_SUFFIXES = tuple(
+    "".join(chars) for chars in itertools.product(".", "wW", "aA", "vV")
+)
+
+
 def get_recording_dates(
     archives: List[str],
     project_config: Optional[Dict[str, Any]] = None,
@@ -1654,34 +1765,40 @@ def get_recording_dates(
 
     minimum_year = project_config.get("minimum_recording_year", 2000)
 
+    # Member names always use "/" (ZIP spec), so rpartition yields the
+    # basename without building a Path per entry — archives routinely hold
+    # thousands of WAVs.
     wav_names = set()
     for archive in archives:
         with zipfile.ZipFile(archive, "r") as zf:
             wav_names.update(
-                Path(name).name
+                name.rpartition("/")[2]
                 for name in zf.namelist()
-                if name.lower().endswith(".wav")
+                if name.endswith(_WAV_SUFFIXES)
             )
 
-    from datetime import datetime as _dt
+    from datetime import date as _date
+
+    # A site records hundreds of WAVs per day, so reduce the names to their
+    # distinct day keys first and validate each day once, not once per file.
+    days = {azus_common.wav_day_key(name) for name in wav_names}
+    days.discard(None)
 
     dates = []
-    for name in wav_names:
+    for day in days:
         # wav_day_key does no calendar validation by design (prep must not
-        # reject an odd filename), so strptime is what rejects an
-        # impossible date like 20241332 — keep the guard.
+        # reject an odd filename), so the date() constructor is what
+        # rejects an impossible date like 20241332 — keep the guard.
+        year, month, dom = day.split("_")
         try:
-            day = azus_common.wav_day_key(name)
-            if day is None:
-                continue
-            parsed = _dt.strptime(day, "%Y_%m_%d").date()
-            # Unset-AudioMoth-clock files (1970) are deliberately kept by
-            # prep but must not date the record; --skip-date-check covers
-            # the case where they are all a site has.
-            if parsed.year >= minimum_year:
-                dates.append(parsed)
-        except (ValueError, IndexError):
+            parsed = _date(int(year), int(month), int(dom))
+        except ValueError:
             continue
+        # Unset-AudioMoth-clock files (1970) are deliberately kept by
+        # prep but must not date the record; --skip-date-check covers
+        # the case where they are all a site has.
+        if parsed.year >= minimum_year:
+            dates.append(parsed)
 
     if not dates:
         raise ValueError("No valid dates found in WAV file names.")
@@ -2116,23 +2233,50 @@ def save_result_csv(file: str, result: PersistedResult) -> None:
     Raises:
         ValueError: If file path is empty.
     """
-    if not file:
-        raise ValueError("Invalid file path for result CSV")
+    save_results_csv(file, [result])
+
 
-    output_file = Path(file)
-    new_file = not output_file.exists()
+def save_results_csv(file: str, results: List[PersistedResult]) -> None:
+    """Append several upload results to a local CSV file in one write.
 
-    if new_file:
-        logger.info("Creating results CSV: %s", file)
-        output_file.parent.mkdir(exist_ok=True, parents=True)
+    The batch form of :func:`save_result_csv`: the file is opened once
+    for the whole list rather than once per row.  Use it only where the
+    rows are all known up front (e.g. discovery-time failures).  A per-
+    dataset outcome must still be written the moment it happens, so a
+    crash mid-run cannot lose the record of uploads already made.
+
+    Args:
+        file: CSV file path.
+        results: Upload results to persist, in order.  An empty list
+            writes nothing (and creates no file).
+
+    Raises:
+        ValueError: If file path is empty and there is a row to write.
+    """
+    if not results:
+        return
+    if not file:
+        raise ValueError("Invalid file path for result CSV")
 
-    result_dict = result.model_dump()
+    rows = [result.model_dump() for result in results]
 
-    with open(file, mode="a", encoding="utf-8", newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=result_dict.keys())
-        if new_file:
+    # Open first and ask the handle whether the file is empty, instead of
+    # exists()-then-open: one syscall fewer, no window between the check
+    # and the open, and a file left empty by an earlier crash still gets
+    # its header.  The Records/ folder is only created on the first
+    # write, when the open finds it missing.
+    try:
+        csv_file = open(file, mode="a", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        Path(file).parent.mkdir(exist_ok=True, parents=True)
+        csv_file = open(file, mode="a", encoding="utf-8", newline="")
+
+    with csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=rows[0].keys())
+        if csv_file.tell() == 0:
+            logger.info("Creating results CSV: %s", file)
             writer.writeheader()
-        writer.writerow(result_dict)
+        writer.writerows(rows)
 
 
 # ===================================================================
@@ -2181,13 +2325,18 @@ class UploadTracker:
             file; an empty set when the file does not exist yet.
         """
         if self.tracker_file.exists():
+            # Strip each line once (the tracker grows by one line per
+            # uploaded archive and is read at every run start).
             with open(self.tracker_file, "r", encoding="utf-8") as fh:
-                return {line.strip() for line in fh if line.strip()}
+                return {path for path in map(str.strip, fh) if path}
         return set()
 
     def is_uploaded(self, file_path: str) -> bool:
         """Check if a file has already been uploaded.
 
+        An O(1) membership test against the in-memory set loaded at
+        construction — no disk access per call.
+
         Args:
             file_path: The file path to look up (compared verbatim
                 against the recorded paths).
@@ -2206,9 +2355,27 @@ class UploadTracker:
         Args:
             file_path: The file path to record as uploaded.
         """
-        self.uploaded_files.add(file_path)
+        self.mark_uploaded_batch([file_path])
+
+    def mark_uploaded_batch(self, file_paths: Iterable[str]) -> None:
+        """Mark several files as successfully uploaded in one write.
+
+        Opens the tracker file once and appends every path with a single
+        ``write`` call, instead of one open/append/close per path.  Only
+        completed uploads should be passed: the marks are still written
+        immediately (not buffered across datasets), because a mark lost to
+        a crash would make the next run publish a duplicate record.
+
+        Args:
+            file_paths: The file paths to record as uploaded.  An empty
+                iterable is a no-op and does not touch the file.
+        """
+        paths = list(file_paths)
+        if not paths:
+            return
+        self.uploaded_files.update(paths)
         with open(self.tracker_file, "a", encoding="utf-8") as fh:
-            fh.write(f"{file_path}\n")
+            fh.write("".join(f"{path}\n" for path in paths))
 
     def get_count(self) -> int:
         """Return the number of previously uploaded files.
@@ -2468,8 +2635,6 @@ def upload_dataset(
     )
     logger.info("  Total files: %d", len(data.all_files))
 
-    import traceback
-
     esid_dir = Path(data.staging_folder)
 
     # ------------------------------------------------------------------
@@ -2543,7 +2708,9 @@ def upload_dataset(
 
     except Exception as exc:
         logger.error("Failed to build draft config for ESID %s: %s", data.esid, exc)
-        logger.debug("Full traceback:\n%s", traceback.format_exc())
+        # exc_info defers formatting to the handler, so the stack is only
+        # walked when DEBUG output is actually enabled.
+        logger.debug("Full traceback:", exc_info=True)
         return {
             "successful": False,
             "error": {
@@ -2670,6 +2837,12 @@ def upload_dataset(
 #  Multi-dataset upload orchestrator
 # ===================================================================
 
+# Folder-name prefixes get_upload_data treats as dataset folders
+# ("ESID_073", "ESID_073_Staging", "ESID#73").  A tuple so one C-level
+# str.startswith call tests them all.
+_ESID_DIR_PREFIXES = ("ESID_", "ESID#")
+
+
 def get_upload_data(
     data_dir: str,
     data_collectors_file: str,
@@ -2679,6 +2852,7 @@ def get_upload_data(
     project_config: Optional[Dict[str, Any]] = None,
     esid_filter: Optional[List[str]] = None,
     stats: Optional[Dict[str, int]] = None,
+    data_collectors: Optional[List[DataCollector]] = None,
 ) -> List[UploadData]:
     """Discover and prepare datasets in a directory for upload.
 
@@ -2705,6 +2879,10 @@ def get_upload_data(
             ``stats["skipped"]`` is incremented by the number of datasets
             dropped because their ZIP is already in the upload tracker —
             so the end-of-run summary reflects reality.
+        data_collectors: Rows of ``data_collectors_file`` already parsed
+            by :func:`parse_collectors_csv` for this ``dataset_category``
+            (``main()``'s CSV pre-validation keeps them).  When given, the
+            CSV is not parsed a second time.  None parses it here.
 
     Returns:
         List of UploadData objects ready for upload — in filter order
@@ -2740,86 +2918,98 @@ def get_upload_data(
             ", ".join(ordered.values()),
         )
 
-    logger.info("Loading data collectors from: %s", data_collectors_file)
-    data_collectors = parse_collectors_csv(
-        csv_file_path=data_collectors_file,
-        dataset_category=dataset_category,
-        project_config=project_config,
-    )
-    logger.info("Loaded %d data collector records", len(data_collectors))
+    if data_collectors is None:
+        logger.info("Loading data collectors from: %s", data_collectors_file)
+        data_collectors = parse_collectors_csv(
+            csv_file_path=data_collectors_file,
+            dataset_category=dataset_category,
+            project_config=project_config,
+        )
+        logger.info("Loaded %d data collector records", len(data_collectors))
+    else:
+        logger.info(
+            "Using %d data collector records already parsed from: %s",
+            len(data_collectors), data_collectors_file,
+        )
 
     # Discover prepared dataset folders.  One folder is one dataset is one
     # Zenodo record, whatever ZIP layout it holds — the archives inside are
     # resolved per folder rather than each becoming its own work item.
     logger.info("Scanning directory: %s", data_dir)
-    data_path = Path(data_dir)
     folder_items: List[Tuple[str, str, List[str]]] = []
+    # Unusable folders are recorded in one failure-CSV write after the scan.
+    layout_failures: List[PersistedResult] = []
+
+    # One os.scandir pass instead of Path.iterdir + is_dir: the cheap name
+    # test runs first, DirEntry.is_dir() is usually answered from the
+    # directory read itself, and a Path is only built for the ESID folders.
+    with os.scandir(data_dir) as entries:
+        esid_dirs = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith(_ESID_DIR_PREFIXES) and entry.is_dir()
+        ]
 
-    for subdir in data_path.iterdir():
-        if subdir.is_dir() and (
-            subdir.name.startswith("ESID_") or subdir.name.startswith("ESID#")
-        ):
-            # Shared parser — tolerant of folder names like "ESID_073",
-            # "ESID_073_Staging" (prepare_dataset.py's name), "ESID#73".
-            # Resolved once here: it is both the filter key and the ESID
-            # the archives are resolved against below.
-            folder_esid = azus_common.parse_esid(subdir.name)
-            if folder_esid is None:
-                logger.debug(
-                    "  Skipping %s (no ESID number in folder name)",
-                    subdir.name,
-                )
-                continue
-
-            # Apply ESID filter before adding to the work list.
-            if normalized_filter is not None:
-                if folder_esid.casefold() not in normalized_filter:
-                    logger.debug(
-                        "  Skipping %s (not in --esid filter)", subdir.name
-                    )
-                    continue
+    for subdir in esid_dirs:
+        # Shared parser — tolerant of folder names like "ESID_073",
+        # "ESID_073_Staging" (prepare_dataset.py's name), "ESID#73".
+        # Resolved once here: it is both the filter key and the ESID
+        # the archives are resolved against below.
+        folder_esid = azus_common.parse_esid(subdir.name)
+        if folder_esid is None:
+            logger.debug(
+                "  Skipping %s (no ESID number in folder name)",
+                subdir.name,
+            )
+            continue
 
-            # Requirement 9: never let the ZIP pipeline touch an ESID that
-            # has been switched to file-by-file mode — only the file-by-file
-            # tool (finish_stuck_uploads.py --enable-file-by-file) finishes
-            # it, so the two never fight over the same Zenodo record. Skip
-            # CLEANLY here (before the no-ZIP failure-row path below), so a
-            # file-by-file folder is not logged as a failure every run.
-            # A per-day folder's marker is STALE — file-by-file cannot apply
-            # to it, so nothing else is contending for its record and
-            # skipping would leave it finishable by no path at all.
-            if azus_common.file_by_file_mode_blocks_zip_path(
-                subdir, folder_esid
-            ):
-                logger.info(
-                    "  Skipping %s — upload_state.json marks it file-by-file "
-                    "mode (finish with finish_stuck_uploads.py "
-                    "--enable-file-by-file).", subdir.name,
+        # Apply ESID filter before adding to the work list.
+        if normalized_filter is not None:
+            if folder_esid.casefold() not in normalized_filter:
+                logger.debug(
+                    "  Skipping %s (not in --esid filter)", subdir.name
                 )
                 continue
 
-            # A staging folder with no usable archive cannot be uploaded.
-            # This used to be skipped with NO logging at all — a mis-staged
-            # dataset simply vanished from the run.  Now it is loud and
-            # recorded.  A mixed-layout folder is refused here too, with
-            # the resolver's own explanation.
-            archives, _mode, layout_problems = resolve_dataset_archives(
-                subdir, folder_esid
-            )
-            if layout_problems:
-                for problem in layout_problems:
-                    logger.warning("ESID folder unusable — skipping: %s", problem)
-                save_result_csv(
-                    file=failure_results_file,
-                    result=PersistedResult(
-                        esid=folder_esid,
-                        error_message="; ".join(layout_problems),
-                    ),
-                )
-                continue
-            folder_items.append(
-                (folder_esid, str(subdir), [str(a) for a in archives])
+        # Requirement 9: never let the ZIP pipeline touch an ESID that
+        # has been switched to file-by-file mode — only the file-by-file
+        # tool (finish_stuck_uploads.py --enable-file-by-file) finishes
+        # it, so the two never fight over the same Zenodo record. Skip
+        # CLEANLY here (before the no-ZIP failure-row path below), so a
+        # file-by-file folder is not logged as a failure every run.
+        # A per-day folder's marker is STALE — file-by-file cannot apply
+        # to it, so nothing else is contending for its record and
+        # skipping would leave it finishable by no path at all.
+        if azus_common.file_by_file_mode_blocks_zip_path(
+            subdir, folder_esid
+        ):
+            logger.info(
+                "  Skipping %s — upload_state.json marks it file-by-file "
+                "mode (finish with finish_stuck_uploads.py "
+                "--enable-file-by-file).", subdir.name,
             )
+            continue
+
+        # A staging folder with no usable archive cannot be uploaded.
+        # This used to be skipped with NO logging at all — a mis-staged
+        # dataset simply vanished from the run.  Now it is loud and
+        # recorded.  A mixed-layout folder is refused here too, with
+        # the resolver's own explanation.
+        archives, _mode, layout_problems = resolve_dataset_archives(
+            subdir, folder_esid
+        )
+        if layout_problems:
+            for problem in layout_problems:
+                logger.warning("ESID folder unusable — skipping: %s", problem)
+            layout_failures.append(PersistedResult(
+                esid=folder_esid,
+                error_message="; ".join(layout_problems),
+            ))
+            continue
+        folder_items.append(
+            (folder_esid, str(subdir), [str(a) for a in archives])
+        )
+    save_results_csv(failure_results_file, layout_failures)
 
     logger.info(
         "Found %d dataset folder(s) matching criteria (%d archive(s) total)",
@@ -2860,13 +3050,15 @@ def get_upload_data(
 
     for esid in unmatched_ids:
         logger.warning("No collector data found for ESID: %s", esid)
-        save_result_csv(
-            file=failure_results_file,
-            result=PersistedResult(
-                esid=esid,
-                error_message="Unable to find data collector info",
-            ),
-        )
+    save_results_csv(
+        failure_results_file,
+        [
+            PersistedResult(
+                esid=esid, error_message="Unable to find data collector info"
+            )
+            for esid in unmatched_ids
+        ],
+    )
 
     if filter_order:
         # Upload in the order the ESIDs were given (--esid order /
@@ -3254,14 +3446,14 @@ def _process_one_dataset_inner(
         with stats_lock:
             stats["successful"] += 1
 
-        # Mark the ZIP as uploaded so future runs skip it.  The tracker
-        # appends one line to ``Records/uploaded_files.txt``; the lock
-        # ensures two threads don't write to that file at the same time.
-        # Record every archive: a dataset counts as uploaded only when all
-        # of them are, so a partial folder re-enters the pipeline next run.
+        # Mark the ZIPs as uploaded so future runs skip them.  The tracker
+        # appends one line per archive to ``Records/uploaded_files.txt`` in
+        # a single write; the lock ensures two threads don't write to that
+        # file at the same time.  Record every archive: a dataset counts as
+        # uploaded only when all of them are, so a partial folder re-enters
+        # the pipeline next run.
         with tracker_lock:
-            for archive in data.archives:
-                tracker.mark_uploaded(archive)
+            tracker.mark_uploaded_batch(data.archives)
 
         # Archive the staging folder into Uploaded_Data/ESID_XXX_Uploaded/.
         # Per-ESID file I/O on a unique path (no two threads touch the same
@@ -3354,6 +3546,9 @@ def upload_datasets(
     verify_zip_hash: bool = True,
     skip_date_check: bool = False,
     skip_existing_records: bool = False,
+    parsed_collectors: Optional[
+        Dict[Tuple[str, str], List[DataCollector]]
+    ] = None,
 ) -> Dict[str, int]:
     """Upload configured datasets to Zenodo.
 
@@ -3430,6 +3625,11 @@ def upload_datasets(
         skip_date_check: Upload datasets whose WAV names carry no
             valid recording dates with the dates recorded as not
             available (``--skip-date-check``); forwarded per dataset.
+        parsed_collectors: Collectors CSVs ``main()`` already parsed
+            while pre-validating, keyed by ``(collectors_csv,
+            dataset_category)`` exactly as they appear in ``datasets``.
+            A dataset found here skips its second CSV parse; any other
+            is parsed by :func:`get_upload_data` as before.
 
     Returns:
         Dictionary with upload statistics:
@@ -3511,6 +3711,9 @@ def upload_datasets(
             project_config=project_config,
             esid_filter=esid_filter,
             stats=stats,
+            data_collectors=(parsed_collectors or {}).get(
+                (collectors_csv, dataset_category)
+            ),
         )
 
         total_in_category = len(category_upload_data)
@@ -3684,11 +3887,13 @@ def main() -> None:
         ),
     )
     parser.add_argument(
-        "--workers", type=int, default=1, metavar="N",
+        "--workers", type=int, default=None, metavar="N",
         help=(
-            "Number of ESID datasets to upload AT THE SAME TIME (default: 1, "
-            "sequential). Each worker uploads one complete dataset (all its "
-            "files end-to-end) before picking up the next one. Files within "
+            "Number of ESID datasets to upload AT THE SAME TIME (default: "
+            "the 'max_concurrent_uploads' value in the config's 'uploads' "
+            "section, else 1 — sequential). Each worker uploads one "
+            "complete dataset (all its files end-to-end) before picking "
+            "up the next one. Files within "
             "a single dataset are still uploaded one at a time — only the "
             "outer 'one ESID after another' loop is parallelized. "
             "Recommended range: 1 to 4. Higher values send more parallel "
@@ -3816,7 +4021,7 @@ def main() -> None:
         )
 
     # --- Validate --workers BEFORE any other work so errors come early ---
-    if args.workers < 1:
+    if args.workers is not None and args.workers < 1:
         parser.error(
             f"--workers must be at least 1 (got {args.workers}). "
             "Use --workers 1 for sequential, or --workers 3 (etc.) to upload "
@@ -3867,20 +4072,34 @@ def main() -> None:
 
     # --- Load configuration ---
     config_path = Path(args.config)
-    if not config_path.exists():
+    logger.info("Loading configuration from: %s", config_path)
+    try:
+        with open(config_path, "r", encoding="utf-8") as fh:
+            config_data = json.load(fh)
+    except FileNotFoundError:
         logger.error("Configuration file not found: %s", config_path)
         sys.exit(1)
 
-    logger.info("Loading configuration from: %s", config_path)
-    with open(config_path, "r", encoding="utf-8") as fh:
-        config_data = json.load(fh)
-
     if "uploads" not in config_data:
         logger.error("Invalid configuration: missing 'uploads' section")
         sys.exit(1)
 
     uploads_config = config_data["uploads"]
 
+    # --- Resolve the worker count (--workers overrides the config) ---
+    # A config.json that always runs concurrently can set
+    # uploads.max_concurrent_uploads once instead of repeating --workers.
+    workers = args.workers
+    if workers is None:
+        workers = uploads_config.get("max_concurrent_uploads", 1)
+        if isinstance(workers, bool) or not isinstance(workers, int) \
+                or workers < 1:
+            logger.error(
+                "Invalid configuration: uploads.max_concurrent_uploads must "
+                "be a whole number of at least 1 (got %r).", workers,
+            )
+            sys.exit(1)
+
     # --- Activate the terminal-output tee now that Records/ is known ---
     # The Records dir is derived exactly like the tracker's: the parent
     # of the successful-results CSV.  The run-start timestamp is shared
@@ -3934,10 +4153,10 @@ def main() -> None:
         )
     else:
         logger.info("ESID filter:  none (all discovered ESIDs will be uploaded)")
-    if args.workers > 1:
+    if workers > 1:
         logger.info(
             "Workers:      %d (uploading %d ESID datasets at a time)",
-            args.workers, args.workers,
+            workers, workers,
         )
     else:
         logger.info("Workers:      1 (sequential — one ESID dataset at a time)")
@@ -3982,6 +4201,10 @@ def main() -> None:
     logger.info("=" * 70)
 
     # --- CSV pre-validation ---
+    # The parsed rows are kept and handed to upload_datasets so each
+    # collectors CSV is parsed once per run, not once here and again per
+    # dataset category.
+    parsed_collectors: Dict[Tuple[str, str], List[DataCollector]] = {}
     if not args.dry_run:
         logger.info("VALIDATING CSV FILES")
         for ds in datasets:
@@ -3994,6 +4217,7 @@ def main() -> None:
                         csv_file, category, project_config
                     )
                     logger.info("  Valid — %d records", len(collectors))
+                    parsed_collectors[(csv_file, category)] = collectors
                 except Exception as exc:
                     logger.error("  CSV validation failed: %s", exc)
                     logger.error(
@@ -4047,7 +4271,7 @@ def main() -> None:
             reserve_doi=uploads_config.get("reserve_doi", False),
             project_config=project_config,
             esid_filter=esid_filter,
-            workers=args.workers,
+            workers=workers,
             defer_zip=args.defer_zip,
             draft_only=args.draft_only,
             upload_attempts=args.upload_attempts,
@@ -4055,6 +4279,7 @@ def main() -> None:
             verify_zip_hash=not args.skip_integrity_hash,
             skip_existing_records=args.skip_existing_records,
             skip_date_check=args.skip_date_check,
+            parsed_collectors=parsed_collectors,
         )
 
         # --- Display summary ---
@@ -12,11 +12,17 @@ Environment variables required:
 """
 
 import hashlib
+import json
 import logging
+import math
 import os
+import stat
 import threading
 import time
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -92,6 +98,12 @@ _DRAFT_PUT_BACKOFF_S = (5, 15)  # before attempts 2 and 3
 # directory on sys.path.
 _HASH_BUFFER_SIZE = 65_536
 
+# Block size for streaming a file body to Zenodo.  Handed a plain file
+# object, urllib3 reads and sends it 16 KiB at a time — some 65,000
+# read()/sendall() pairs per GiB.  _FileChunks feeds it 1 MiB blocks
+# instead; only one block is held in memory per upload.
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
 # (connect, read) timeout applied to EVERY Zenodo HTTP call.  Without a
 # timeout, a half-open connection (proxy drop, load-balancer black hole)
 # blocks forever — and never raises, so the retry/backoff machinery never
@@ -105,34 +117,153 @@ _REQUEST_TIMEOUT = (_CONNECT_TIMEOUT_S, _READ_TIMEOUT_S)
 
 
 # ===================================================================
-#  File integrity verification
+#  HTTP session reuse
 # ===================================================================
+# The module-level ``requests.post()`` & co. build and tear down a fresh
+# Session — and with it the TCP connection and TLS handshake — on every
+# call, so one dataset's dozen-plus API calls paid a handshake each.  A
+# Session keeps the connection alive between calls to the same host.
+#
+# One Session PER THREAD, not one per process: ``requests.Session`` is
+# not documented as thread-safe, and ``--workers N`` runs N datasets on
+# pool threads.  Each worker reuses its own connection across every
+# dataset it uploads.  No transport-level retries are mounted: retrying
+# is decided per call in this module, because several calls (draft
+# creation, new-version creation) must never be blindly repeated.
+#
+# The Session's cookie jar is the one other thing it adds over bare
+# ``requests.post()``.  It is set to refuse every cookie: Zenodo
+# authenticates each call with the bearer token, and a cookie picked up
+# from one response must not ride along on later calls for other
+# datasets.  Only connection pooling changes.
+_THREAD_STATE = threading.local()
+
+
+def _session() -> requests.Session:
+    """Return this thread's shared ``requests.Session``, creating it once.
+
+    Every Zenodo HTTP call in this module goes through it, so tests patch
+    this one seam instead of the ``requests`` module.
 
-class FileIntegrityError(Exception):
-    """A file on Zenodo does not match the local file it should mirror.
+    Returns:
+        The calling thread's Session.
+    """
+    session = getattr(_THREAD_STATE, "session", None)
+    if session is None:
+        session = requests.Session()
+        # An empty allow-list blocks cookies from every domain.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _THREAD_STATE.session = session
+    return session
 
-    Raised when a committed upload's size/checksum disagrees with the
-    local file, or when a resume run cannot verify an already-committed
-    file.  Always fails the dataset — a mismatched file must never be
-    left on a record that could be published.
+
+# ===================================================================
+#  Rate limiting (HTTP 429)
+# ===================================================================
+
+# Upper bound on a server-requested Retry-After wait.  Zenodo's limiter
+# asks for seconds to a minute.  The wait is a plain time.sleep() that
+# neither Ctrl+C's abort flag nor a sibling worker can cut short, so the
+# cap is kept inside the fixed PUT backoffs (up to 270 s) rather than
+# letting a misconfigured header park a worker thread for hours.
+_RETRY_AFTER_CAP_S = 120
+
+
+class _RateLimitedError(RequestException):
+    """An HTTP 429, carrying the wait Zenodo asked for.
+
+    A ``RequestException`` so the existing retry loops catch it like any
+    transient error; ``retry_after_s`` lets them stretch their fixed
+    backoff to at least the server-requested delay.
+
+    Attributes:
+        retry_after_s: Seconds from the ``Retry-After`` header,
+            clamped to ``_RETRY_AFTER_CAP_S``; 0 when absent, malformed
+            or already past.
     """
 
+    def __init__(self, message: str, retry_after_s: int = 0):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+def _retry_after_s(response: "requests.Response") -> int:
+    """Parse a ``Retry-After`` header into clamped whole seconds.
 
-def _rate_limit_message(response: "requests.Response", label: str) -> str:
-    """Build the retry message for an HTTP 429, honouring ``Retry-After``.
+    Both RFC 9110 forms are accepted: delay-seconds (``"120"``) and an
+    HTTP date (``"Wed, 21 Oct 2026 07:28:00 GMT"``), which is turned
+    into the seconds from now until then.  Any other value is logged
+    and ignored.
+
+    Args:
+        response: The 429 response.
+
+    Returns:
+        The requested delay in seconds (0 to ``_RETRY_AFTER_CAP_S``), or
+        0 when the header is missing, malformed, negative, or a date in
+        the past.
+    """
+    raw = str((response.headers or {}).get("Retry-After", "")).strip()
+    if not raw:
+        return 0
+    # Parsed with int(), never float(): int("inf") / int("1e400") are
+    # plain ValueErrors, where int(float(...)) raised OverflowError —
+    # uncaught by the upload loop, so one bad header would have crashed
+    # the whole run.
+    try:
+        seconds = int(raw)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(raw)
+        except (TypeError, ValueError, IndexError):
+            logger.warning(
+                "  Ignoring unparseable Retry-After header %r.", raw,
+            )
+            return 0
+        if when.tzinfo is None:
+            # "-0000" parses to a naive datetime; HTTP dates are UTC.
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = math.ceil(
+            (when - datetime.now(timezone.utc)).total_seconds()
+        )
+    return min(max(seconds, 0), _RETRY_AFTER_CAP_S)
+
+
+def _rate_limited(
+    response: "requests.Response", label: str
+) -> _RateLimitedError:
+    """Build the error to raise for an HTTP 429, honouring ``Retry-After``.
+
+    The header is parsed once; the same value names the wait in the
+    message and stretches the retry loop's backoff.
 
     Args:
         response: The 429 response.
         label: What was being requested, for the log line.
 
     Returns:
-        A message naming the wait Zenodo asked for, when it supplied one.
+        A ``_RateLimitedError`` whose message names the wait Zenodo asked
+        for, when it supplied a usable one.
     """
-    retry_after = (response.headers or {}).get("Retry-After", "")
-    suffix = (
-        f" Zenodo asked for {retry_after}s." if str(retry_after).strip() else ""
+    retry_after_s = _retry_after_s(response)
+    suffix = f"; Zenodo asked for {retry_after_s}s" if retry_after_s else ""
+    return _RateLimitedError(
+        f"Rate limited (HTTP 429) on {label}{suffix}", retry_after_s,
     )
-    return f"Rate limited (HTTP 429) on {label}.{suffix}"
+
+
+# ===================================================================
+#  File integrity verification
+# ===================================================================
+
+class FileIntegrityError(Exception):
+    """A file on Zenodo does not match the local file it should mirror.
+
+    Raised when a committed upload's size/checksum disagrees with the
+    local file, or when a resume run cannot verify an already-committed
+    file.  Always fails the dataset — a mismatched file must never be
+    left on a record that could be published.
+    """
 
 
 def _calculate_md5(file_path: str) -> str:
@@ -151,6 +282,45 @@ def _calculate_md5(file_path: str) -> str:
     return md5.hexdigest()
 
 
+class _FileChunks:
+    """Iterable PUT body that streams an open file in large blocks.
+
+    Exposes ``__len__`` (so requests sends a ``Content-Length`` header
+    rather than chunked transfer encoding) but no ``read()`` (so urllib3
+    iterates it instead of re-reading the file in its own 16 KiB blocks).
+    One-shot: a second iteration continues from the file's current
+    offset, so the body cannot be replayed (e.g. on a redirect).
+
+    Args:
+        fh: Binary file object positioned at the start of the content.
+        chunk_size: Bytes per block yielded to the transport.
+        digest: Optional hashlib object updated with every block as it
+            is handed to the transport, so the bytes sent are hashed
+            without a second read of the file.
+
+    Attributes:
+        bytes_read: Bytes yielded so far.  Differs from ``len()`` (the
+            size at open) when the file shrank or grew mid-upload.
+    """
+
+    def __init__(self, fh, chunk_size: int = _UPLOAD_CHUNK_SIZE, digest=None):
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._digest = digest
+        self._length = os.fstat(fh.fileno()).st_size
+        self.bytes_read = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        for block in iter(lambda: self._fh.read(self._chunk_size), b""):
+            self.bytes_read += len(block)
+            if self._digest is not None:
+                self._digest.update(block)
+            yield block
+
+
 def _read_state(state_file: Path) -> Dict[str, Any]:
     """Read an existing ``upload_state.json`` into a dict.
 
@@ -169,8 +339,7 @@ def _read_state(state_file: Path) -> Dict[str, Any]:
     if not state_file.is_file():
         return {}
     try:
-        import json as _json
-        data = _json.loads(state_file.read_text(encoding="utf-8"))
+        data = json.loads(state_file.read_text(encoding="utf-8"))
         return data if isinstance(data, dict) else {}
     except (OSError, ValueError, TypeError) as exc:
         logger.warning(
@@ -217,7 +386,6 @@ def _write_upload_state(
         is_resume: Whether this run resumed an existing draft.
     """
     try:
-        import json as _json
         from datetime import datetime as _dt
         state_path = Path(state_file_path)
         state = _read_state(state_path)
@@ -232,7 +400,7 @@ def _write_upload_state(
             "resumed": is_resume,
             "number_of_tries": prior_tries + 1,
         })
-        state_path.write_text(_json.dumps(state, indent=2), encoding="utf-8")
+        state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
         logger.info(
             "  Wrote upload state file (attempt #%d): %s",
             state["number_of_tries"], state_file_path,
@@ -366,7 +534,7 @@ def create_draft_record(
         HTTPError: If the API request fails.
     """
     url = f"{credentials.base_url}records"
-    response = requests.post(
+    response = _session().post(
         url,
         json=metadata,
         headers=_auth_headers(credentials, content_type="application/json"),
@@ -707,7 +875,9 @@ def upload_file_to_draft(
         known_md5: Precomputed md5 hex digest of ``file_path`` from an
             earlier integrity pass.  When supplied it is reused for the
             post-commit verification, sparing a second full read of a
-            multi-GB file; when None the digest is computed here.
+            multi-GB file; when None the file is hashed here, before the
+            PUT.  Either way the bytes the PUT streams are hashed too and
+            must match this digest before the upload is committed.
 
     Returns:
         API response with committed file details.
@@ -717,32 +887,36 @@ def upload_file_to_draft(
         HTTPError: If any API step fails.
         FileIntegrityError: If the committed file's size or checksum on
             Zenodo does not match the local file.  The broken slot is
-            deleted before raising, so the draft stays clean.
+            deleted before raising, so the draft stays clean.  Also
+            raised, before commit, when the bytes streamed by the PUT do
+            not match the local md5 (the file changed after it was
+            hashed, or while it was being sent).
     """
     file_path_obj = Path(file_path)
-    if not file_path_obj.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
 
     # Local facts captured up front — what Zenodo holds after the commit
     # must match these exactly (post-commit verification below).
     # known_md5 (from the integrity gate's combined digest pass) saves a
     # second full read of a multi-GB ZIP; if the file changed since that
     # hash was taken, the post-commit comparison against Zenodo's actual
-    # checksum fails the dataset — fail-closed either way.
-    local_size = file_path_obj.stat().st_size
-    if known_md5:
-        local_md5 = known_md5
-    else:
-        logger.debug("  Hashing %s (md5) for post-upload verification...",
-                     file_path_obj.name)
-        local_md5 = _calculate_md5(file_path)
+    # checksum fails the dataset — fail-closed either way.  One stat()
+    # both proves the file exists and gives its size.
+    try:
+        local_size = file_path_obj.stat().st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    # The reference digest is always taken independently of the PUT.
+    # The md5 of the streamed bytes is only compared against it: using
+    # the stream's own digest as the reference would make the
+    # post-commit check confirm whatever was sent.
+    local_md5 = known_md5 or _calculate_md5(file_path)
 
     url = f"{credentials.base_url}records/{record_id}/draft/files"
     auth = _auth_headers(credentials)
 
     # Step 1: Initialize file upload
     init_data = [{"key": file_path_obj.name}]
-    response = requests.post(
+    response = _session().post(
         url, json=init_data, headers=auth, timeout=_REQUEST_TIMEOUT,
     )
     response.raise_for_status()
@@ -772,15 +946,25 @@ def upload_file_to_draft(
     # keeps working.  A cleanup failure must NOT mask the original
     # upload error — log it as a warning and re-raise the PUT error.
     try:
-        _put_file_content_with_retry(
+        sent_md5 = _put_file_content_with_retry(
             url=file_entry["links"]["content"],
             file_path=file_path,
             auth_headers=auth,
             attempts=upload_attempts,
+            hash_md5=True,
         )
-    except (HTTPError, RequestException) as put_exc:
+        if sent_md5 != local_md5:
+            raise FileIntegrityError(
+                f"Bytes sent for {file_path_obj.name} have md5:{sent_md5} "
+                f"but the local file is md5:{local_md5} — the file changed "
+                f"after it was hashed."
+            )
+    except (HTTPError, RequestException, FileIntegrityError) as put_exc:
+        # FileIntegrityError: the bytes sent are not the file that was
+        # hashed — the slot holds a body that must never be committed,
+        # so clean it too.
         logger.info(
-            "  Cleaning up pending file slot for %s after exhausted retries...",
+            "  Cleaning up pending file slot for %s after the failed PUT...",
             file_path_obj.name,
         )
         try:
@@ -802,7 +986,7 @@ def upload_file_to_draft(
         raise put_exc
 
     # Step 3: Commit the file
-    commit_response = requests.post(
+    commit_response = _session().post(
         file_entry["links"]["commit"], headers=auth,
         timeout=_REQUEST_TIMEOUT,
     )
@@ -845,7 +1029,8 @@ def _put_file_content_with_retry(
     file_path: str,
     auth_headers: Dict[str, str],
     attempts: int = _PUT_RETRY_ATTEMPTS,
-) -> None:
+    hash_md5: bool = False,
+) -> Optional[str]:
     """PUT file bytes to the draft content URL with retry on transport errors.
 
     Retries on `RequestException` (covers SSLError, ConnectionError, Timeout,
@@ -857,6 +1042,11 @@ def _put_file_content_with_retry(
     semantics in InvenioRDM mean the server-side content is overwritten on
     every successful PUT, so retrying is safe.
 
+    Redirects are not followed.  The body is a one-shot ``_FileChunks``
+    iterator that requests cannot rewind, so re-sending it to a 307/308
+    target would send an empty body under the original Content-Length.
+    A 3xx response is raised as an ``HTTPError`` instead, like a 4xx.
+
     Args:
         url: Zenodo draft content URL.
         file_path: Local file to upload.
@@ -867,31 +1057,64 @@ def _put_file_content_with_retry(
             for direct importers.  Backoffs come from
             ``_PUT_RETRY_BACKOFF_S`` and are consumed only between
             attempts; the last attempt is followed by no wait.
+        hash_md5: When True, md5 the bytes as they are streamed and
+            return the digest of the successful attempt's body.  That
+            digest describes what was SENT, not the file on disk, so it
+            is only returned when the whole body was streamed: the bytes
+            hashed must equal the size captured when the file was opened.
+            Callers compare it against an independent digest of the file.
+
+    Returns:
+        The md5 hex digest of the bytes sent when ``hash_md5`` is True,
+        otherwise None.
 
     Raises:
         RequestException or HTTPError: the last error if all attempts fail.
+            A 3xx or 4xx response raises ``HTTPError`` at once.
+        FileIntegrityError: When ``hash_md5`` is True and the number of
+            bytes streamed differs from the file's size at open (the file
+            changed mid-upload, or the body was not fully consumed) — a
+            digest of an incomplete body must never pass the post-commit
+            checksum comparison.
     """
     last_exc: Optional[BaseException] = None
     for attempt in range(1, attempts + 1):
         try:
+            # A fresh digest per attempt: each retry resends from byte 0.
+            md5 = hashlib.md5() if hash_md5 else None
             with open(file_path, "rb") as fh:
-                response = requests.put(
-                    url, data=fh, headers=auth_headers,
-                    timeout=_REQUEST_TIMEOUT,
+                body = _FileChunks(fh, digest=md5)
+                response = _session().put(
+                    url, data=body, headers=auth_headers,
+                    timeout=_REQUEST_TIMEOUT, allow_redirects=False,
                 )
             if response.status_code == 429:
                 # See _api_get_with_retry: 429 is the retryable 4xx.
-                raise RequestException(
-                    _rate_limit_message(response, Path(file_path).name)
-                )
+                raise _rate_limited(response, Path(file_path).name)
             # Treat 5xx as a transient error worth retrying; 4xx is fatal.
             if 500 <= response.status_code < 600:
                 raise RequestException(
                     f"Server error HTTP {response.status_code}: "
                     f"{response.text[:200]}"
                 )
+            if 300 <= response.status_code < 400:
+                # Not followed: the one-shot body cannot be re-sent.
+                raise HTTPError(
+                    f"PUT for {Path(file_path).name} was redirected "
+                    f"(HTTP {response.status_code}); a streamed upload "
+                    f"cannot be re-sent to a new location.",
+                    response=response,
+                )
             response.raise_for_status()
-            return
+            if md5 is None:
+                return None
+            if body.bytes_read != len(body):
+                raise FileIntegrityError(
+                    f"Streamed {body.bytes_read} bytes of "
+                    f"{Path(file_path).name} but it was {len(body)} bytes "
+                    f"when opened — the file changed during upload."
+                )
+            return md5.hexdigest()
         except HTTPError:
             # 4xx — do not retry.
             raise
@@ -899,7 +1122,10 @@ def _put_file_content_with_retry(
             last_exc = exc
             file_name = Path(file_path).name
             if attempt < attempts:
-                backoff = _PUT_RETRY_BACKOFF_S[attempt - 1]
+                backoff = max(
+                    _PUT_RETRY_BACKOFF_S[attempt - 1],
+                    getattr(exc, "retry_after_s", 0),
+                )
                 logger.warning(
                     "  PUT failed for %s (attempt %d/%d): %s: %s. "
                     "Retrying in %ds...",
@@ -934,7 +1160,7 @@ def publish_draft(
         HTTPError: If the publish request fails.
     """
     url = f"{credentials.base_url}records/{record_id}/draft/actions/publish"
-    response = requests.post(
+    response = _session().post(
         url, headers=_auth_headers(credentials), timeout=_REQUEST_TIMEOUT,
     )
     response.raise_for_status()
@@ -952,7 +1178,7 @@ def delete_draft(credentials: Credentials, record_id: str) -> None:
         HTTPError: If the delete request fails.
     """
     url = f"{credentials.base_url}records/{record_id}/draft"
-    response = requests.delete(
+    response = _session().delete(
         url, headers=_auth_headers(credentials), timeout=_REQUEST_TIMEOUT,
     )
     response.raise_for_status()
@@ -994,7 +1220,7 @@ def _api_get_with_retry(
     last_exc: Optional[BaseException] = None
     for attempt in range(1, _API_RETRY_ATTEMPTS + 1):
         try:
-            response = requests.get(
+            response = _session().get(
                 url, headers=auth_headers, params=params,
                 timeout=_REQUEST_TIMEOUT,
             )
@@ -1005,9 +1231,7 @@ def _api_get_with_retry(
                 # fatal — but it is the one 4xx that retrying DOES fix.
                 # Route it into the backoff below, honouring Retry-After
                 # when Zenodo supplies one.
-                raise RequestException(
-                    _rate_limit_message(response, label)
-                )
+                raise _rate_limited(response, label)
             if 500 <= response.status_code < 600:
                 raise RequestException(
                     f"Server error HTTP {response.status_code}: "
@@ -1021,7 +1245,10 @@ def _api_get_with_retry(
         except RequestException as exc:
             last_exc = exc
             if attempt < _API_RETRY_ATTEMPTS:
-                backoff = _API_RETRY_BACKOFF_S[attempt - 1]
+                backoff = max(
+                    _API_RETRY_BACKOFF_S[attempt - 1],
+                    getattr(exc, "retry_after_s", 0),
+                )
                 logger.warning(
                     "  %s failed (attempt %d/%d): %s: %s. Retrying in %ds...",
                     label, attempt, _API_RETRY_ATTEMPTS,
@@ -1149,7 +1376,7 @@ def create_new_version_draft(
     """
     url = f"{credentials.base_url}records/{record_id}/versions"
     logger.info("  Creating a new version draft of record %s...", record_id)
-    response = requests.post(
+    response = _session().post(
         url, headers=_auth_headers(credentials), timeout=_REQUEST_TIMEOUT,
     )
     response.raise_for_status()
@@ -1196,7 +1423,7 @@ def update_draft_metadata(
     last_exc: Optional[BaseException] = None
     for attempt in range(1, _DRAFT_PUT_ATTEMPTS + 1):
         try:
-            response = requests.put(
+            response = _session().put(
                 url,
                 headers=_auth_headers(credentials, "application/json"),
                 json=payload,
@@ -1277,7 +1504,7 @@ def delete_draft_file(
         HTTPError: If the delete request fails with a status other than 404.
     """
     url = f"{credentials.base_url}records/{record_id}/draft/files/{key}"
-    response = requests.delete(
+    response = _session().delete(
         url, headers=_auth_headers(credentials), timeout=_REQUEST_TIMEOUT,
     )
     # 404 is fine — the slot is already gone.
@@ -1443,7 +1670,7 @@ def ensure_doi_reserved(
     last_exc: Optional[BaseException] = None
     for attempt in range(1, _DOI_RESERVE_ATTEMPTS + 1):
         try:
-            response = requests.post(
+            response = _session().post(
                 url, headers=_auth_headers(credentials),
                 timeout=_REQUEST_TIMEOUT,
             )
@@ -1532,7 +1759,7 @@ def _create_community_review_request(
         "receiver": {"community": community_id},
         "type": "community-submission",
     }
-    response = requests.put(
+    response = _session().put(
         url,
         json=payload,
         headers=_auth_headers(credentials, content_type="application/json"),
@@ -1580,7 +1807,7 @@ def submit_to_community_review(
     # Step 2: Submit the draft into the community review queue
     logger.info("  Submitting to community review queue...")
     url = f"{credentials.base_url}records/{record_id}/draft/actions/submit-review"
-    response = requests.post(
+    response = _session().post(
         url,
         headers=_auth_headers(credentials, content_type="application/json"),
         timeout=_REQUEST_TIMEOUT,
@@ -1716,6 +1943,35 @@ def upload_to_zenodo(
     is_resume = False
 
     try:
+        # --- Local pre-flight ------------------------------------------
+        # Every local file must exist BEFORE any API call.  Discovering a
+        # missing file mid-loop meant a draft had already been created
+        # (and possibly half-filled) for a dataset that could never
+        # complete.  Raised as FileNotFoundError so the handler below
+        # reports it like any other bad local file; no draft exists yet.
+        # The one stat per file also records its size, reused by the
+        # resume verification and the per-file progress line below
+        # instead of stat()ing every file again (a round trip each on a
+        # network / Dropbox mount).
+        local_sizes: Dict[str, int] = {}
+        missing: List[str] = []
+        for f in files:
+            try:
+                st = os.stat(f)
+            except (OSError, ValueError):
+                # Same answer os.path.isfile gives for these.
+                missing.append(f)
+                continue
+            if stat.S_ISREG(st.st_mode):
+                local_sizes[f] = st.st_size
+            else:
+                missing.append(f)
+        if missing:
+            raise FileNotFoundError(
+                "Local file(s) not found, nothing uploaded: "
+                + ", ".join(missing)
+            )
+
         # --- Duplicate guard -------------------------------------------
         # Runs ONLY when there is no local resume pointer — exactly the
         # dangerous situation: if a record with this title already exists
@@ -1919,14 +2175,13 @@ def upload_to_zenodo(
             # Persist the outgoing request payload for debugging / audit
             if request_log_path:
                 try:
-                    import json as _json
                     log_entry = {
                         "record_id": record_id,
                         "request": {"body": draft_metadata},
                         "response": draft_response,
                     }
                     Path(request_log_path).write_text(
-                        _json.dumps(log_entry, indent=2), encoding="utf-8"
+                        json.dumps(log_entry, indent=2), encoding="utf-8"
                     )
                     logger.info(
                         "  Request log saved: %s", Path(request_log_path).name
@@ -1989,7 +2244,7 @@ def upload_to_zenodo(
                     # records forever, even after the local ZIP was fixed.
                     local_path = local_by_name[key]
                     try:
-                        local_size = Path(local_path).stat().st_size
+                        local_size = local_sizes[local_path]
                         mismatch = _remote_entry_mismatch(entry, local_size)
                         if (
                             mismatch is None
@@ -2063,8 +2318,9 @@ def upload_to_zenodo(
                         ),
                     },
                 }
-            file_name = Path(file_path).name
-            file_size_mb = Path(file_path).stat().st_size / (1024 * 1024)
+            file_path_obj = Path(file_path)
+            file_name = file_path_obj.name
+            file_size_mb = local_sizes[file_path] / (1024 * 1024)
 
             logger.info(
                 "  [%d/%d] Uploading %s (%.2f MB)...",
@@ -0,0 +1,133 @@
+"""Unit tests for standalone_tasks.py's small directory/file helpers.
+
+Covers ``list_dir_files`` (glob-based listing and its invalid-directory
+contract) and ``get_esid_file_pairs`` (ESID extraction from the base
+name of each path, with a warning for names that carry no ESID).
+All paths live inside a TemporaryDirectory.
+
+Run from the project root:
+
+    python3 -m unittest tests.test_dir_file_helpers -v
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+import standalone_tasks as tasks  # noqa: E402
+
+
+class _TmpDirTestCase(unittest.TestCase):
+    """Shared per-test TemporaryDirectory as ``self.root`` (a Path)."""
+
+    def setUp(self):
+        # addCleanup, not tearDown: cleanups run last-in first-out, so a
+        # test's own chmod restore runs before the directory is removed.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+
+# ===================================================================
+#  list_dir_files
+# ===================================================================
+
+class TestListDirFiles(_TmpDirTestCase):
+    def setUp(self):
+        super().setUp()
+        for name in ("a.zip", "ab.zip", "B.ZIP", ".hidden.zip", "notes.txt"):
+            (self.root / name).write_bytes(b"x")
+        (self.root / "dir.zip").mkdir()
+        (self.root / "sub").mkdir()
+        (self.root / "sub" / "c.zip").write_bytes(b"x")
+
+    def names(self, pattern="*"):
+        return sorted(
+            os.path.basename(p)
+            for p in tasks.list_dir_files(str(self.root), pattern)
+        )
+
+    def test_star_lists_visible_files_only(self):
+        self.assertEqual(
+            self.names(), ["B.ZIP", "a.zip", "ab.zip", "notes.txt"]
+        )
+
+    def test_dot_pattern_lists_hidden_files(self):
+        self.assertEqual(self.names(".*"), [".hidden.zip"])
+
+    def test_patterns_are_case_sensitive_on_posix(self):
+        if os.path.normcase("A") != "A":
+            self.skipTest("glob is case-insensitive on this platform")
+        self.assertEqual(self.names("*.ZIP"), ["B.ZIP"])
+        self.assertEqual(self.names("*.zip"), ["a.zip", "ab.zip"])
+
+    def test_question_mark_matches_one_character(self):
+        self.assertEqual(self.names("?.zip"), ["a.zip"])
+
+    def test_nested_pattern_and_full_paths(self):
+        self.assertEqual(
+            tasks.list_dir_files(str(self.root), "sub/*.zip"),
+            [os.path.join(str(self.root), "sub", "c.zip")],
+        )
+
+    def test_missing_path_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            tasks.list_dir_files(str(self.root / "nope"))
+
+    def test_file_path_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            tasks.list_dir_files(str(self.root / "a.zip"))
+
+    def test_empty_directory_argument_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            tasks.list_dir_files("")
+
+    @unittest.skipIf(
+        hasattr(os, "geteuid") and os.geteuid() == 0,
+        "chmod 000 does not block listing for root",
+    )
+    def test_unreadable_directory_lists_nothing(self):
+        """It IS a directory, so no ValueError; glob swallows the
+        PermissionError from the listing and reports no matches."""
+        locked = self.root / "locked"
+        locked.mkdir()
+        (locked / "d.zip").write_bytes(b"x")
+        locked.chmod(0o000)
+        self.addCleanup(locked.chmod, 0o755)
+        self.assertEqual(tasks.list_dir_files(str(locked)), [])
+
+
+# ===================================================================
+#  get_esid_file_pairs
+# ===================================================================
+
+class TestGetEsidFilePairs(unittest.TestCase):
+    def test_esid_parsed_from_basename_of_nested_paths(self):
+        # The directory names carry ESID-like text too; only the file
+        # name's last path component may be parsed.
+        paths = [
+            "/data/ESID_999/staging/ESID_005.zip",
+            os.path.join("ESID_888", "ESID#12.zip"),
+        ]
+        self.assertEqual(
+            tasks.get_esid_file_pairs(paths),
+            [("005", paths[0]), ("012", paths[1])],
+        )
+
+    def test_unparseable_names_are_skipped_with_a_warning(self):
+        paths = ["/data/ESID_005/readme.zip", "/data/ESID_007.zip"]
+        with self.assertLogs("azus", level="WARNING") as logs:
+            pairs = tasks.get_esid_file_pairs(paths)
+        self.assertEqual(pairs, [("007", paths[1])])
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("readme.zip", logs.output[0])
+        self.assertNotIn("/data", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
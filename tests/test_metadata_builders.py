@@ -1,7 +1,8 @@
 """Unit tests for the metadata builders in standalone_tasks.py.
 
 Covers the config-driven Zenodo metadata pipeline: load_project_config,
-build_creators / build_contributors / build_fundings, get_draft_config,
+build_creators / build_contributors / build_fundings,
+parse_collectors_csv, get_draft_config, save_metadata_json,
 get_recording_dates, read_upload_manifest, and create_upload_data.
 
 Hermetic: everything runs inside tempfile.TemporaryDirectory.  The
@@ -17,6 +18,7 @@ Run from the project root:
 import csv
 import json
 import logging
+import os
 import shutil
 import sys
 import tempfile
@@ -398,6 +400,115 @@ class TestGetDraftConfig(TempDirTestCase):
         )
 
 
+# --- parse_collectors_csv --------------------------------------------------------
+
+_COLLECTOR_ROW = {
+    "ESID": "5",
+    "Data Collector Affiliations": "Eclipse Soundscapes : ARISA Lab",
+    "WAV Files Time & Date Settings": "Automatic",
+    "Version": "2024.1.0",
+    "Latitude": "35.0000",
+    "Longitude": "-106.0000",
+    "Eclipse Date": "2024-04-08",
+    "Local Eclipse Type": "Total",
+    "Eclipse Percent (%)": "100",
+    "Eclipse Start Time (UTC) (1st Contact)": "17:00:00",
+    "Eclipse Maximum (UTC)": "18:15:00",
+    "Keywords and subjects": "eclipse : audiomoth",
+}
+
+
+class TestParseCollectorsCsv(TempDirTestCase):
+    def _write(self, rows, extra_columns=()):
+        path = self.root / "collectors.csv"
+        header = list(_COLLECTOR_ROW) + list(extra_columns)
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(row)
+        return path
+
+    def _parse(self, path, config=None):
+        return tasks.parse_collectors_csv(
+            str(path), "Total", config or {"csv_required_headers": []}
+        )
+
+    def test_rows_match_dictreader_validation(self):
+        # Unused spreadsheet columns (and a blank line) must not change
+        # what the model sees.
+        path = self._write(
+            [list(_COLLECTOR_ROW.values()) + ["a@b.org", "note"], [],
+             list(_COLLECTOR_ROW.values()) + ["c@d.org", ""]],
+            extra_columns=("Contact Email", "Notes"),
+        )
+        with open(path, encoding="utf-8", newline="") as fh:
+            expected = [
+                DataCollector.model_validate(row)
+                for row in csv.DictReader(fh)
+            ]
+        parsed = self._parse(path)
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual(parsed, expected)
+        self.assertEqual(parsed[0].esid, "005")
+
+    def test_short_row_fails_validation(self):
+        # DictReader fills missing cells with None; a required field read
+        # as None must still be a validation error, not a silent blank.
+        path = self._write([list(_COLLECTOR_ROW.values())[:3]])
+        with self.assertRaises(ValueError):
+            self._parse(path)
+
+    def test_missing_required_header_raises(self):
+        path = self._write([list(_COLLECTOR_ROW.values())])
+        with self.assertRaises(ValueError) as cm:
+            self._parse(path, {"csv_required_headers": ["Site Name"]})
+        self.assertIn("Site Name", str(cm.exception))
+
+    def test_empty_file_raises(self):
+        path = self.root / "empty.csv"
+        path.write_text("", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            self._parse(path)
+
+    def test_every_model_field_input_name_is_kept(self):
+        # A field added to DataCollector later must not be dropped from
+        # the parsed rows because its column is missing from the set.
+        for name, field in DataCollector.model_fields.items():
+            alias = field.validation_alias
+            keys = {name, field.alias} | (
+                {alias} if isinstance(alias, str)
+                else set(getattr(alias, "choices", ()))
+            )
+            for key in keys - {None}:
+                with self.subTest(field=name, key=key):
+                    self.assertIn(key, tasks._COLLECTOR_CSV_COLUMNS)
+
+
+# --- save_metadata_json ---------------------------------------------------------
+
+class TestSaveMetadataJson(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.config = load_example_config(self.root)
+        self.readme = self.root / "README.html"
+        self.readme.write_text(
+            TestGetDraftConfig.README_HTML, encoding="utf-8"
+        )
+
+    def _draft(self):
+        return tasks.get_draft_config(
+            data_collector=make_collector(),
+            readme_html_path=str(self.readme),
+            project_config=self.config,
+        )
+
+    def test_default_output_is_indented(self):
+        path = tasks.save_metadata_json(self._draft(), "005", self.root)
+        text = path.read_text(encoding="utf-8")
+        self.assertIn('\n  "metadata": {', text)
+
+
 # --- get_recording_dates --------------------------------------------------------
 
 class TestGetRecordingDates(TempDirTestCase):
@@ -440,6 +551,32 @@ class TestGetRecordingDates(TempDirTestCase):
             ("2024-04-08", "2024-04-08"),
         )
 
+    def test_wav_suffix_match_is_case_insensitive_and_nested(self):
+        # Any casing of ".wav" counts, and a member inside a folder in the
+        # archive is dated by its basename.
+        zip_path = make_zip(
+            self.root / "ESID_005.zip",
+            ["20240408_120000.wav", "sub/20240410_090000.wAv",
+             "20240409_130000.Wav"],
+        )
+        self.assertEqual(
+            tasks.get_recording_dates([str(zip_path)], self.config),
+            ("2024-04-08", "2024-04-10"),
+        )
+
+    def test_impossible_calendar_dates_ignored(self):
+        # wav_day_key only reads the 8-digit prefix; month 13 and Feb 30
+        # must still be rejected before they can date the record.
+        zip_path = make_zip(
+            self.root / "ESID_005.zip",
+            ["20241332_000000.WAV", "20240230_000000.WAV",
+             "20240408_120000.WAV", "20240408_130000.WAV"],
+        )
+        self.assertEqual(
+            tasks.get_recording_dates([str(zip_path)], self.config),
+            ("2024-04-08", "2024-04-08"),
+        )
+
     def test_no_valid_dates_raises_value_error(self):
         zip_path = make_zip(
             self.root / "ESID_005.zip",
@@ -511,6 +648,83 @@ class TestReadUploadManifest(TempDirTestCase):
         found = tasks.read_upload_manifest(manifest, self.root)
         self.assertEqual(list(found), ["ESID_005.zip"])
 
+    def test_listed_sub_path_resolves(self):
+        # Not in the top-level directory listing, so it takes the
+        # Path.is_file() fallback.
+        (self.root / "docs").mkdir()
+        (self.root / "docs" / "README.md").write_text("x")
+        manifest = write_manifest(
+            self.root / "ESID_005_to_upload.csv", ["docs/README.md"],
+        )
+        found = tasks.read_upload_manifest(manifest, self.root)
+        self.assertEqual(
+            found, {"docs/README.md": str(self.root / "docs" / "README.md")},
+        )
+
+    def test_directory_named_like_a_file_is_missing(self):
+        (self.root / "Companion.csv").mkdir()
+        manifest = write_manifest(
+            self.root / "ESID_005_to_upload.csv", ["Companion.csv"],
+        )
+        with self.assertRaises(FileNotFoundError) as cm:
+            tasks.read_upload_manifest(manifest, self.root)
+        self.assertIn("Companion.csv", str(cm.exception))
+
+    @unittest.skipIf(
+        hasattr(os, "geteuid") and os.geteuid() == 0,
+        "chmod does not block listing for root",
+    )
+    def test_unlistable_directory_falls_back_to_per_name_checks(self):
+        # Execute-only: scandir raises PermissionError, but each file can
+        # still be reached by name.
+        locked = self.root / "locked"
+        locked.mkdir()
+        (locked / "ESID_005.zip").write_bytes(b"data")
+        locked.chmod(0o100)
+        self.addCleanup(locked.chmod, 0o755)
+        manifest = write_manifest(
+            self.root / "ESID_005_to_upload.csv",
+            ["ESID_005.zip", "GHOST_FILE.csv"],
+        )
+        with self.assertRaises(FileNotFoundError) as cm:
+            tasks.read_upload_manifest(manifest, locked)
+        self.assertIn("GHOST_FILE.csv", str(cm.exception))
+        self.assertNotIn("ESID_005.zip", str(cm.exception))
+
+
+# --- find_dataset_files ------------------------------------------------------------
+
+class TestFindDatasetFiles(TempDirTestCase):
+    def test_default_file_list_without_manifest(self):
+        (self.root / "ESID_005.zip").write_bytes(b"data")
+        found = tasks.find_dataset_files(
+            str(self.root), "005",
+            required_files=["ESID_005.zip", "README.html"],
+        )
+        self.assertEqual(
+            found,
+            {"ESID_005.zip": str(self.root / "ESID_005.zip"),
+             "README.html": None},
+        )
+
+    def test_missing_folder_raises_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            tasks.find_dataset_files(str(self.root / "nope"), "005")
+
+    def test_file_instead_of_folder_raises_value_error(self):
+        not_a_dir = self.root / "ESID_005.zip"
+        not_a_dir.write_bytes(b"data")
+        with self.assertRaises(ValueError):
+            tasks.find_dataset_files(str(not_a_dir), "005")
+
+    def test_manifest_takes_precedence(self):
+        (self.root / "ESID_005.zip").write_bytes(b"data")
+        write_manifest(self.root / "ESID_005_to_upload.csv", ["ESID_005.zip"])
+        found = tasks.find_dataset_files(
+            str(self.root), "005", required_files=["README.html"],
+        )
+        self.assertEqual(list(found), ["ESID_005.zip"])
+
 
 # --- create_upload_data ------------------------------------------------------------
 
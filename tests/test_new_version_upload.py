@@ -450,6 +450,16 @@ class TestNewVersionPrimitives(unittest.TestCase):
         patcher.start()
         self.addCleanup(patcher.stop)
 
+    def _patch_session(self, method, **behaviour):
+        """Patch ``uploader._session``; return the mock for ``method``."""
+        session = mock.Mock()
+        getattr(session, method).configure_mock(**behaviour)
+        patcher = mock.patch.object(uploader, "_session",
+                                    return_value=session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return getattr(session, method)
+
     def test_get_published_record_url_and_404(self):
         with mock.patch.object(
             uploader, "_api_get_with_retry", return_value=None
@@ -470,11 +480,10 @@ class TestNewVersionPrimitives(unittest.TestCase):
         self.assertEqual(body["id"], _RECORD)
 
     def test_create_new_version_posts_to_versions_with_no_body(self):
-        with mock.patch.object(
-            uploader.requests, "post",
-            return_value=FakeResponse(version_draft()),
-        ) as post:
-            body = uploader.create_new_version_draft(self.creds, _RECORD)
+        post = self._patch_session(
+            "post", return_value=FakeResponse(version_draft()),
+        )
+        body = uploader.create_new_version_draft(self.creds, _RECORD)
         self.assertEqual(body["id"], _NEW_RECORD)
         self.assertEqual(post.call_args.args[0],
                          f"{_BASE_URL}records/{_RECORD}/versions")
@@ -483,49 +492,46 @@ class TestNewVersionPrimitives(unittest.TestCase):
 
     def test_create_new_version_is_never_retried(self):
         """A 5xx may still have created the draft; a retry could not tell."""
-        with mock.patch.object(
-            uploader.requests, "post",
-            return_value=FakeResponse(status_code=500, text="boom"),
-        ) as post:
-            with self.assertRaises(HTTPError):
-                uploader.create_new_version_draft(self.creds, _RECORD)
+        post = self._patch_session(
+            "post", return_value=FakeResponse(status_code=500, text="boom"),
+        )
+        with self.assertRaises(HTTPError):
+            uploader.create_new_version_draft(self.creds, _RECORD)
         self.assertEqual(post.call_count, 1)
 
     def test_update_draft_metadata_puts_the_payload_untouched(self):
         payload = {"metadata": {"version": _NEW_LABEL}, "pids": {}}
-        with mock.patch.object(
-            uploader.requests, "put", return_value=FakeResponse({"ok": True}),
-        ) as put:
-            uploader.update_draft_metadata(self.creds, _NEW_RECORD, payload)
+        put = self._patch_session(
+            "put", return_value=FakeResponse({"ok": True}),
+        )
+        uploader.update_draft_metadata(self.creds, _NEW_RECORD, payload)
         self.assertEqual(put.call_args.args[0],
                          f"{_BASE_URL}records/{_NEW_RECORD}/draft")
         self.assertEqual(put.call_args.kwargs["json"], payload)
 
     def test_update_draft_metadata_retries_5xx_then_succeeds(self):
-        with mock.patch.object(
-            uploader.requests, "put",
-            side_effect=[FakeResponse(status_code=503, text="down"),
-                         FakeResponse({"ok": True})],
-        ) as put:
-            uploader.update_draft_metadata(self.creds, _NEW_RECORD, {})
+        put = self._patch_session("put", side_effect=[
+            FakeResponse(status_code=503, text="down"),
+            FakeResponse({"ok": True}),
+        ])
+        uploader.update_draft_metadata(self.creds, _NEW_RECORD, {})
         self.assertEqual(put.call_count, 2)
 
     def test_update_draft_metadata_does_not_retry_4xx(self):
-        with mock.patch.object(
-            uploader.requests, "put",
+        put = self._patch_session(
+            "put",
             return_value=FakeResponse(status_code=400, text="bad field"),
-        ) as put:
-            with self.assertRaises(HTTPError):
-                uploader.update_draft_metadata(self.creds, _NEW_RECORD, {})
+        )
+        with self.assertRaises(HTTPError):
+            uploader.update_draft_metadata(self.creds, _NEW_RECORD, {})
         self.assertEqual(put.call_count, 1)
 
     def test_update_draft_metadata_raises_after_exhausting_retries(self):
-        with mock.patch.object(
-            uploader.requests, "put",
-            return_value=FakeResponse(status_code=500, text="down"),
-        ) as put:
-            with self.assertRaises(RequestException):
-                uploader.update_draft_metadata(self.creds, _NEW_RECORD, {})
+        put = self._patch_session(
+            "put", return_value=FakeResponse(status_code=500, text="down"),
+        )
+        with self.assertRaises(RequestException):
+            uploader.update_draft_metadata(self.creds, _NEW_RECORD, {})
         self.assertEqual(put.call_count, uploader._DRAFT_PUT_ATTEMPTS)
 
 
@@ -276,7 +276,7 @@ class TestPerDayPrepToUpload(unittest.TestCase):
         _item, _kwargs, move, tracker = self._upload()
         move.assert_called_once()
         self.assertEqual(
-            sorted(c.args[0] for c in tracker.mark_uploaded.call_args_list),
+            sorted(tracker.mark_uploaded_batch.call_args.args[0]),
             sorted(
                 str(self.staging_root / f"ESID_{_ESID}_Staging"
                     / f"ESID_{_ESID}_{day}.zip")
@@ -296,6 +296,7 @@ class TestPerDayPrepToUpload(unittest.TestCase):
         # A deferred record is incomplete: nothing is tracked or moved.
         move.assert_not_called()
         tracker.mark_uploaded.assert_not_called()
+        tracker.mark_uploaded_batch.assert_not_called()
 
     def test_legacy_single_zip_prep_still_uploads_as_one_record(self):
         """The permanent legacy path, driven the same way."""
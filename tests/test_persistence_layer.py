@@ -5,8 +5,9 @@ relies on to avoid duplicate work:
 
   * ``standalone_tasks.UploadTracker`` — the one-path-per-line
     ``uploaded_files.txt`` dedupe record (append, reload, count).
-  * ``standalone_tasks.save_result`` / ``save_result_csv`` — the
-    success/failure result CSVs (routing, header-once, append-only).
+  * ``standalone_tasks.save_result`` / ``save_result_csv`` /
+    ``save_results_csv`` — the success/failure result CSVs (routing,
+    header-once, append-only, batched appends).
   * ``standalone_tasks._recover_draft_id_from_request_log`` — case-7
     recovery of a draft's record_id from ``ESID_XXX_request_log.json``.
   * ``finish_stuck_uploads.discover_stuck_esids`` — Staging_Area/ scan
@@ -83,6 +84,26 @@ class TestUploadTracker(_TmpDirTestCase):
         lines = self.tracker_file.read_text(encoding="utf-8").splitlines()
         self.assertEqual(lines, ["/data/ESID_005.zip", "/data/ESID_007.zip"])
 
+    def test_mark_uploaded_batch_appends_every_path_in_order(self):
+        tracker = self._tracker()
+        tracker.mark_uploaded("/data/ESID_005.zip")
+        tracker.mark_uploaded_batch(
+            ["/data/ESID_007_2024_04_08.zip", "/data/ESID_007_2024_04_09.zip"]
+        )
+        lines = self.tracker_file.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines, [
+            "/data/ESID_005.zip",
+            "/data/ESID_007_2024_04_08.zip",
+            "/data/ESID_007_2024_04_09.zip",
+        ])
+        self.assertTrue(tracker.is_uploaded("/data/ESID_007_2024_04_09.zip"))
+
+    def test_empty_batch_does_not_create_tracker_file(self):
+        tracker = self._tracker()
+        tracker.mark_uploaded_batch([])
+        self.assertFalse(self.tracker_file.exists())
+        self.assertEqual(tracker.get_count(), 0)
+
     def test_is_uploaded_true_after_mark(self):
         tracker = self._tracker()
         tracker.mark_uploaded("/data/ESID_005.zip")
@@ -208,6 +229,28 @@ class TestSaveResultCsv(_TmpDirTestCase):
             ["005", "007", "012"],
         )
 
+    def test_batch_write_matches_row_by_row_appends(self):
+        from models.audiomoth import PersistedResult
+
+        target = str(self.root / "results.csv")
+        tasks.save_result_csv(file=target, result=PersistedResult(esid="005"))
+        tasks.save_results_csv(
+            target,
+            [PersistedResult(esid="007"), PersistedResult(esid="012")],
+        )
+        with open(target, newline="", encoding="utf-8") as fh:
+            raw = list(csv.reader(fh))
+        self.assertEqual(len(raw), 4)  # still exactly one header line
+        self.assertEqual(
+            [row["esid"] for row in self._rows(target)],
+            ["005", "007", "012"],
+        )
+
+    def test_empty_batch_creates_no_file(self):
+        target = self.root / "Records" / "results.csv"
+        tasks.save_results_csv(str(target), [])
+        self.assertFalse(target.exists())
+
     def test_creates_missing_parent_directories(self):
         from models.audiomoth import PersistedResult
 
@@ -217,6 +260,18 @@ class TestSaveResultCsv(_TmpDirTestCase):
         )
         self.assertEqual(self._rows(target)[0]["esid"], "005")
 
+    def test_existing_empty_file_gets_a_header(self):
+        # A zero-byte CSV (e.g. left by a crash between create and write)
+        # must not end up with data rows and no header.
+        from models.audiomoth import PersistedResult
+
+        target = self.root / "results.csv"
+        target.write_text("", encoding="utf-8")
+        tasks.save_result_csv(
+            file=str(target), result=PersistedResult(esid="005")
+        )
+        self.assertEqual(self._rows(target)[0]["esid"], "005")
+
     def test_empty_file_path_rejected(self):
         from models.audiomoth import PersistedResult
 
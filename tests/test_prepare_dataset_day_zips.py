@@ -183,6 +183,24 @@ class TestAppleDoubleSidecars(_Case):
         self.assertNotIn(self.sidecar.name, names)
         self.assertEqual(set(names), set(_WAVS))
 
+    def test_order_and_case_match_the_legacy_globs(self):
+        """One scandir pass, same result as the two sorted globs."""
+        for name in ("20240408_090000.wav", "20240408_080000.wav",
+                     "20240408_070000.Wav"):
+            write_wav(self.source / name, 2000)
+        legacy = [
+            p for p in (
+                sorted(self.source.glob("*.WAV"))
+                + sorted(self.source.glob("*.wav"))
+            )
+            if azus_common.is_raw_wav_name(p.name)
+        ]
+        self.assertEqual(prep.raw_wav_files(self.source), legacy)
+        self.assertNotIn(
+            "20240408_070000.Wav",
+            [p.name for p in prep.raw_wav_files(self.source)],
+        )
+
     def test_grouping_does_not_refuse(self):
         by_day = prep.group_wavs_by_day(prep.raw_wav_files(self.source))
         self.assertEqual(list(by_day), list(_DAYS))
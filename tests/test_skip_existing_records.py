@@ -137,6 +137,7 @@ class TestSkipsWhatZenodoAlreadyHolds(_Case):
         m["upload"].assert_not_called()
         m["move"].assert_not_called()
         m["tracker"].mark_uploaded.assert_not_called()
+        m["tracker"].mark_uploaded_batch.assert_not_called()
 
     def test_published_record_is_skipped_not_failed(self):
         """A published record means the site is finished; it belongs in the
@@ -210,6 +210,25 @@ class TestTrackerSemantics(_PerDayFolder):
         self.assertEqual(data[0].archives, [str(a) for a in archives])
 
 
+class TestPreparsedCollectors(_PerDayFolder):
+    """Rows main() already parsed while pre-validating are reused."""
+
+    def test_supplied_rows_skip_the_csv_parse(self):
+        self.build()
+        with mock.patch.object(tasks, "parse_collectors_csv") as parse:
+            (item,) = tasks.get_upload_data(
+                data_dir=str(self.staging_root),
+                data_collectors_file="collectors.csv",
+                dataset_category="Total",
+                failure_results_file=str(self.root / "failed.csv"),
+                tracker=mock.MagicMock(is_uploaded=lambda p: False),
+                project_config={"default_required_files": []},
+                data_collectors=[make_collector()],
+            )
+        parse.assert_not_called()
+        self.assertEqual(item.esid, _ESID)
+
+
 class TestVersionMarker(_PerDayFolder):
     """The per-day marker prep writes into the staging folder's own
     total_eclipse_data.csv must reach the record."""
@@ -389,7 +408,7 @@ class TestArchiveMoveHappensOncePerFolder(_PerDayFolder):
         self.assertEqual(move.call_args.args[0], self.folder.resolve())
         # And every archive is recorded, not just one.
         self.assertEqual(
-            sorted(c.args[0] for c in tracker.mark_uploaded.call_args_list),
+            sorted(tracker.mark_uploaded_batch.call_args.args[0]),
             sorted(str(a) for a in archives),
         )
 
@@ -0,0 +1,117 @@
+"""Unit tests for the body sent by standalone_uploader.py's content PUT.
+
+``_put_file_content_with_retry`` streams the file through a one-shot
+``_FileChunks`` body and, with ``hash_md5=True``, returns the md5 of the
+bytes it sent.  These tests pin when that digest may be returned (only
+for a body streamed in full) and that a redirected PUT is refused rather
+than re-sent with an exhausted body.  No network access: ``_session`` is
+patched to return a mock whose ``put`` plays the transport.
+
+Run from the project root:
+
+    python3 -m unittest tests.test_uploader_put_digest -v
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from requests.exceptions import HTTPError
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+import standalone_uploader as uploader  # noqa: E402
+
+
+class _Response:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.text = ""
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class _PutTestBase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "ESID_005_2024_04_08.zip")
+        self.content = os.urandom(3 * 1024 * 1024 + 5)
+        with open(self.path, "wb") as fh:
+            fh.write(self.content)
+
+    def _put(self, on_put, status_code=200, attempts=1):
+        """Run the PUT; ``on_put`` receives the body the transport got.
+
+        Returns the digest.  The session mock is kept as ``self.session``.
+        """
+        def fake_put(url, data=None, **kwargs):
+            on_put(data)
+            return _Response(status_code)
+
+        self.session = mock.Mock()
+        self.session.put.side_effect = fake_put
+        with mock.patch.object(uploader, "_session",
+                               return_value=self.session):
+            return uploader._put_file_content_with_retry(
+                "https://zenodo.example/files/x/content", self.path, {},
+                attempts=attempts, hash_md5=True,
+            )
+
+
+class TestPutDigestCoversWholeFile(_PutTestBase):
+    """hash_md5 digests describe the bytes SENT; they must only be
+    returned when those bytes are the whole file as sized at open."""
+
+    def test_fully_streamed_body_returns_its_md5(self):
+        digest = self._put(lambda body: b"".join(body))
+        self.assertEqual(digest, hashlib.md5(self.content).hexdigest())
+
+    def test_file_truncated_mid_upload_is_refused(self):
+        def truncate_then_send(body):
+            with open(self.path, "r+b") as fh:
+                fh.truncate(1024)
+            b"".join(body)
+
+        with self.assertRaises(uploader.FileIntegrityError):
+            self._put(truncate_then_send)
+
+    def test_partially_consumed_body_is_refused(self):
+        def send_first_block_only(body):
+            next(iter(body))
+
+        with self.assertRaises(uploader.FileIntegrityError):
+            self._put(send_first_block_only)
+
+
+class TestRedirectedPut(_PutTestBase):
+    def test_body_cannot_be_replayed(self):
+        # What a followed 307/308 would send: the second pass is empty.
+        with open(self.path, "rb") as fh:
+            body = uploader._FileChunks(fh)
+            self.assertEqual(b"".join(body), self.content)
+            self.assertEqual(b"".join(body), b"")
+
+    def test_redirects_are_not_followed(self):
+        self._put(lambda body: b"".join(body))
+        self.assertIs(
+            self.session.put.call_args.kwargs["allow_redirects"], False
+        )
+
+    def test_redirect_response_raises_without_retry(self):
+        with self.assertRaises(HTTPError) as ctx:
+            self._put(lambda body: None, status_code=307, attempts=3)
+        self.assertIn("redirected", str(ctx.exception))
+        self.assertEqual(ctx.exception.response.status_code, 307)
+        self.session.put.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
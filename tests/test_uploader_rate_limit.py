@@ -0,0 +1,139 @@
+"""Unit tests for standalone_uploader.py's HTTP 429 handling.
+
+A 429 is the one 4xx the retry loops treat as transient.  When Zenodo
+sends a ``Retry-After`` (seconds or an HTTP date), the backoff before
+the next attempt is stretched to at least that long (capped at
+``_RETRY_AFTER_CAP_S``).  No network access: ``_session`` is patched
+and ``time.sleep`` is recorded, never slept.
+
+Run from the project root:
+
+    python3 -m unittest tests.test_uploader_rate_limit -v
+"""
+
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from unittest import mock
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+import standalone_uploader as uploader  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+    def raise_for_status(self):
+        pass
+
+
+class TestRetryAfterParsing(unittest.TestCase):
+    def test_numeric_header_is_used(self):
+        self.assertEqual(
+            uploader._retry_after_s(FakeResponse(429, {"Retry-After": "42"})),
+            42,
+        )
+
+    def test_missing_header_is_zero(self):
+        self.assertEqual(uploader._retry_after_s(FakeResponse(429)), 0)
+
+    def test_http_date_is_seconds_from_now(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=90)
+        waited = uploader._retry_after_s(FakeResponse(
+            429, {"Retry-After": format_datetime(when, usegmt=True)},
+        ))
+        self.assertTrue(88 <= waited <= 91, waited)
+
+    def test_past_http_date_is_zero(self):
+        self.assertEqual(
+            uploader._retry_after_s(FakeResponse(
+                429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            )),
+            0,
+        )
+
+    def test_far_http_date_is_capped(self):
+        self.assertEqual(
+            uploader._retry_after_s(FakeResponse(
+                429, {"Retry-After": "Fri, 01 Jan 9999 00:00:00 GMT"},
+            )),
+            uploader._RETRY_AFTER_CAP_S,
+        )
+
+    def test_negative_seconds_are_zero(self):
+        self.assertEqual(
+            uploader._retry_after_s(FakeResponse(429, {"Retry-After": "-30"})),
+            0,
+        )
+
+    def test_malformed_values_are_zero_and_logged(self):
+        # "inf" / "1e400" used to raise OverflowError via int(float(...)).
+        for raw in ("inf", "-inf", "nan", "1e400", "1.5", "soon"):
+            with self.subTest(raw=raw):
+                with self.assertLogs("azus.uploader", "WARNING") as logs:
+                    waited = uploader._retry_after_s(
+                        FakeResponse(429, {"Retry-After": raw})
+                    )
+                self.assertEqual(waited, 0)
+                self.assertIn(repr(raw), logs.output[0])
+
+    def test_huge_value_is_capped(self):
+        self.assertEqual(
+            uploader._retry_after_s(
+                FakeResponse(429, {"Retry-After": "86400"})
+            ),
+            uploader._RETRY_AFTER_CAP_S,
+        )
+
+
+class TestApiGetHonoursRetryAfter(unittest.TestCase):
+    def _run(self, first_response):
+        session = mock.Mock()
+        session.get.side_effect = [first_response, FakeResponse(200)]
+        with mock.patch.object(
+            uploader, "_session", return_value=session,
+        ), mock.patch.object(uploader.time, "sleep") as sleep:
+            uploader._api_get_with_retry(
+                "https://zenodo.example/api/x", {}, label="GET x",
+            )
+        return [c.args[0] for c in sleep.call_args_list]
+
+    def test_longer_retry_after_stretches_the_backoff(self):
+        waits = self._run(FakeResponse(429, {"Retry-After": "120"}))
+        self.assertEqual(waits, [120])
+
+    def test_shorter_retry_after_keeps_the_fixed_backoff(self):
+        waits = self._run(FakeResponse(429, {"Retry-After": "1"}))
+        self.assertEqual(waits, [uploader._API_RETRY_BACKOFF_S[0]])
+
+    def test_overflowing_retry_after_keeps_the_fixed_backoff(self):
+        with self.assertLogs("azus.uploader", "WARNING"):
+            waits = self._run(FakeResponse(429, {"Retry-After": "1e400"}))
+        self.assertEqual(waits, [uploader._API_RETRY_BACKOFF_S[0]])
+
+
+class TestRateLimitedError(unittest.TestCase):
+    def test_message_reuses_the_parsed_value(self):
+        exc = uploader._rate_limited(
+            FakeResponse(429, {"Retry-After": "86400"}), "GET x"
+        )
+        self.assertEqual(exc.retry_after_s, uploader._RETRY_AFTER_CAP_S)
+        self.assertIn(f"asked for {uploader._RETRY_AFTER_CAP_S}s", str(exc))
+
+    def test_no_usable_header_means_no_wait_in_message(self):
+        exc = uploader._rate_limited(
+            FakeResponse(429, {"Retry-After": "inf"}), "GET x"
+        )
+        self.assertEqual(exc.retry_after_s, 0)
+        self.assertNotIn("asked for", str(exc))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -258,11 +258,29 @@ class TestResumeUnverifiableLocalFile(_ResumeTestBase):
         mocks["upload_file_to_draft"].assert_not_called()
 
     def test_missing_local_file_fails_without_deleting_remote(self):
+        """A missing local file is caught by the pre-flight check, before
+        the draft is even fetched — so nothing remote is touched."""
         missing = self.tmp / "ESID_005.zip"  # never created
         result, mocks = self.run_resume(
             [missing], [committed_entry(missing.name, _SIZE, _MD5)]
         )
-        self._assert_failed_closed(result, mocks)
+        self.assertFalse(result["successful"])
+        self.assertEqual(result["error"]["type"], "FileNotFoundError")
+        self.assertIn(str(missing), result["error"]["error_message"])
+        mocks["get_draft_record"].assert_not_called()
+        mocks["delete_draft_file"].assert_not_called()
+        mocks["upload_file_to_draft"].assert_not_called()
+
+    def test_directory_in_file_list_fails_preflight(self):
+        """A directory is not an uploadable file (os.path.isfile semantics)."""
+        folder = self.tmp / "ESID_005.zip"
+        folder.mkdir()
+        result, mocks = self.run_resume(
+            [folder], [committed_entry(folder.name, _SIZE, _MD5)]
+        )
+        self.assertEqual(result["error"]["type"], "FileNotFoundError")
+        mocks["get_draft_record"].assert_not_called()
+        mocks["upload_file_to_draft"].assert_not_called()
 
     @unittest.skipIf(
         hasattr(os, "geteuid") and os.geteuid() == 0,
@@ -316,10 +334,17 @@ class TestUploadFileToDraftPostCommitVerification(unittest.TestCase):
     def _scripted_http(self, stack, commit_payload):
         """Patch the HTTP layer so init, PUT, and commit all succeed.
 
-        requests.post serves the init response first, then the commit
-        response; requests.put (the content upload) succeeds.  Returns
-        the delete_draft_file mock for slot-cleanup assertions.
+        ``_session`` returns ``self.session``, a mock whose post serves
+        the init response first, then the commit response; its put (the
+        content upload) drains the streamed body as the real transport
+        would, then succeeds.
+        Returns the delete_draft_file mock for slot-cleanup assertions.
         """
+        def put(url, data=None, **kwargs):
+            for _block in data:
+                pass
+            return FakeResponse()
+
         init_payload = {
             "entries": [{
                 "key": self.local.name,
@@ -329,15 +354,14 @@ class TestUploadFileToDraftPostCommitVerification(unittest.TestCase):
                 },
             }]
         }
+        self.session = mock.Mock()
+        self.session.post.side_effect = [
+            FakeResponse(init_payload),
+            FakeResponse(commit_payload),
+        ]
+        self.session.put.side_effect = put
         stack.enter_context(mock.patch.object(
-            uploader.requests, "post",
-            side_effect=[
-                FakeResponse(init_payload),
-                FakeResponse(commit_payload),
-            ],
-        ))
-        stack.enter_context(mock.patch.object(
-            uploader.requests, "put", return_value=FakeResponse()
+            uploader, "_session", return_value=self.session
         ))
         return stack.enter_context(
             mock.patch.object(uploader, "delete_draft_file")
@@ -385,6 +409,60 @@ class TestUploadFileToDraftPostCommitVerification(unittest.TestCase):
         self.assertEqual(outcome, commit_payload)
         delete_mock.assert_not_called()
 
+    def test_reference_md5_is_hashed_before_the_put(self):
+        """Without known_md5 the file is hashed on its own, so the
+        post-commit check never compares the stream against itself."""
+        commit_payload = {
+            "key": self.local.name,
+            "status": "completed",
+            "size": _SIZE,
+            "checksum": f"md5:{_MD5}",
+        }
+        with ExitStack() as stack:
+            self._scripted_http(stack, commit_payload)
+            pre_hash = stack.enter_context(mock.patch.object(
+                uploader, "_calculate_md5", wraps=uploader._calculate_md5
+            ))
+            outcome = uploader.upload_file_to_draft(
+                self.credentials, "1234567", str(self.local)
+            )
+        self.assertEqual(outcome, commit_payload)
+        pre_hash.assert_called_once_with(str(self.local))
+
+    def test_file_changed_after_hashing_fails_before_commit(self):
+        """A stale known_md5 disagrees with the streamed bytes; the
+        slot is deleted before commit (the commit response would raise
+        'failed verification' instead)."""
+        with ExitStack() as stack:
+            delete_mock = self._scripted_http(stack, {})
+            with self.assertRaises(uploader.FileIntegrityError) as ctx:
+                uploader.upload_file_to_draft(
+                    self.credentials, "1234567", str(self.local),
+                    known_md5="0" * 32,
+                )
+        self.assertIn("changed after it was hashed", str(ctx.exception))
+        delete_mock.assert_called_once()
+
+    def test_file_shrinking_mid_put_fails_before_commit(self):
+        """The streamed digest would describe a short body; it must not
+        reach the post-commit comparison."""
+        def truncating_put(url, data=None, **kwargs):
+            with open(self.local, "r+b") as fh:
+                fh.truncate(_SIZE // 2)
+            for _block in data:
+                pass
+            return FakeResponse()
+
+        with ExitStack() as stack:
+            delete_mock = self._scripted_http(stack, {})
+            self.session.put.side_effect = truncating_put
+            with self.assertRaises(uploader.FileIntegrityError) as ctx:
+                uploader.upload_file_to_draft(
+                    self.credentials, "1234567", str(self.local)
+                )
+        self.assertIn("changed during upload", str(ctx.exception))
+        delete_mock.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,108 @@
+"""Unit tests for standalone_uploader.py's HTTP session reuse.
+
+Every Zenodo call goes through ``_session()``, which hands each thread
+one long-lived ``requests.Session`` so keep-alive connections are reused
+across calls and datasets; its cookie jar refuses every cookie.  No
+network access: only the Session objects themselves are inspected.
+File PUT bodies are streamed through ``_FileChunks``; those tests only
+prepare the request, never send it.
+
+Run from the project root:
+
+    python3 -m unittest tests.test_uploader_session -v
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.client import HTTPMessage
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+import standalone_uploader as uploader  # noqa: E402
+
+
+class TestSessionReuse(unittest.TestCase):
+    def test_same_thread_reuses_one_session(self):
+        first = uploader._session()
+        self.assertIsInstance(first, requests.Session)
+        self.assertIs(uploader._session(), first)
+
+    def test_each_thread_gets_its_own_session(self):
+        # requests.Session is not documented as thread-safe, so --workers
+        # pool threads must never share one.
+        main_session = uploader._session()
+        seen = []
+        worker = threading.Thread(
+            target=lambda: seen.extend([uploader._session(),
+                                        uploader._session()])
+        )
+        worker.start()
+        worker.join()
+        self.assertIs(seen[0], seen[1])
+        self.assertIsNot(seen[0], main_session)
+
+
+class TestSessionCookies(unittest.TestCase):
+    """The shared Session must not carry cookies between calls."""
+
+    @staticmethod
+    def _receive_cookie(session):
+        # What requests does with a response's Set-Cookie header.
+        msg = HTTPMessage()
+        msg["Set-Cookie"] = "session=abc123; Path=/; Secure"
+        raw = mock.Mock()
+        raw._original_response.msg = msg
+        request = requests.Request(
+            "GET", "https://zenodo.example/api/records/1"
+        ).prepare()
+        requests.cookies.extract_cookies_to_jar(session.cookies, request, raw)
+
+    def test_plain_session_would_store_the_cookie(self):
+        session = requests.Session()
+        self._receive_cookie(session)
+        self.assertEqual(len(session.cookies), 1)
+
+    def test_shared_session_refuses_cookies(self):
+        session = uploader._session()
+        self._receive_cookie(session)
+        self.assertEqual(len(session.cookies), 0)
+
+
+class TestFileChunksBody(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "ESID_005_2024_04_08.zip")
+        self.content = os.urandom(2 * 1024 + 7)
+        with open(self.path, "wb") as fh:
+            fh.write(self.content)
+
+    def test_yields_whole_file_in_chunk_sized_blocks(self):
+        with open(self.path, "rb") as fh:
+            blocks = list(uploader._FileChunks(fh, chunk_size=1024))
+        self.assertEqual([len(b) for b in blocks], [1024, 1024, 7])
+        self.assertEqual(b"".join(blocks), self.content)
+
+    def test_put_is_sent_with_content_length_not_chunked(self):
+        # A streamed body without a length would make requests fall back to
+        # Transfer-Encoding: chunked and drop the Content-Length header.
+        with open(self.path, "rb") as fh:
+            prepared = requests.Request(
+                "PUT", "https://zenodo.example/files/x/content",
+                data=uploader._FileChunks(fh),
+            ).prepare()
+        self.assertEqual(prepared.headers["Content-Length"],
+                         str(len(self.content)))
+        self.assertNotIn("Transfer-Encoding", prepared.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -193,8 +193,8 @@ class TestFindTitleMatches(unittest.TestCase):
 class TestUploadTitleGuard(_PatchingTestCase):
     """Behavior of upload_to_zenodo's duplicate guard, fully offline.
 
-    Every network function is replaced; ``uploader.requests`` itself is
-    swapped for a tripwire that fails the test on any direct HTTP call.
+    Every network function is replaced; ``uploader._session`` itself
+    returns a tripwire that fails the test on any direct HTTP call.
     """
 
     def setUp(self):
@@ -222,7 +222,7 @@ class TestUploadTitleGuard(_PatchingTestCase):
             getattr(tripwire, verb).side_effect = AssertionError(
                 f"unexpected direct requests.{verb} call"
             )
-        self._patch("requests", new=tripwire)
+        self._patch("_session", return_value=tripwire)
 
     def _search_returns(self, hits):
         self.search.return_value = FakeResponse({"hits": {"hits": hits}})
@@ -371,7 +371,7 @@ class TestUploadTitleGuard(_PatchingTestCase):
 class TestEnsureDoiReserved(_PatchingTestCase):
     def setUp(self):
         self.creds = uploader.Credentials(token="fake", base_url=_BASE_URL)
-        self.requests = self._patch("requests")
+        self.requests = self._patch("_session").return_value
         self.get_draft = self._patch("get_draft_record")
         self._patch("logger")
         # Neutralize the retry backoff sleeps so 5xx cases run instantly.
@@ -535,7 +535,7 @@ class TestNumberOfTriesCounter(_PatchingTestCase):
             getattr(tripwire, verb).side_effect = AssertionError(
                 f"unexpected direct requests.{verb} call"
             )
-        self._patch("requests", new=tripwire)
+        self._patch("_session", return_value=tripwire)
 
     def _state(self):
         return json.loads(self.state_path.read_text(encoding="utf-8"))